@@ -0,0 +1,8 @@
+"""Mam: infinite quantum terrain runner.
+
+The modules directly in this package (terrain generation, streaming,
+baking, simulation, spatial queries) only need NumPy and never import
+arcade or pyglet, so tools and worker processes start quickly. Everything
+that draws or plays sound lives in mam.render, which is only imported
+when a game window is opened.
+"""
@@ -0,0 +1,25 @@
+"""Run the game: python -m mam [--world FILE ...] [--shared-chunks]"""
+import argparse
+
+from .bake import BakedWorld
+from .constants import SCREEN_TITLE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument('--world', action='append', default=[],
+                        help="baked world file to stream terrain from (see mam/bake.py); "
+                             "repeat for other modes or wave mode")
+    parser.add_argument('--shared-chunks', action='store_true',
+                        help="share generated chunks with other game/simulation processes on this machine")
+    args = parser.parse_args(argv)
+
+    baked_worlds = [BakedWorld(path) for path in args.world]
+
+    # The graphics stack is only loaded once a window is actually needed
+    from .render.game import run
+    run(baked_worlds, args.shared_chunks)
+
+
+if __name__ == "__main__":
+    main()
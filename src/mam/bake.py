@@ -0,0 +1,216 @@
+"""Offline world baker: pre-generate chunks in parallel into a streamable file.
+
+Usage:
+    PYTHONPATH=src python -m mam.bake world.mamw --region -32 -32 32 32 --workers 8
+    PYTHONPATH=src python -m mam.bake wave.mamw --region -32 -32 32 32 --wave-mode
+
+File layout (little endian):
+    header:  magic 'MAMW', version, chunk size, master seed, wave mode, terrain mode
+    records: chunk_x, chunk_y, payload length, crc32, zlib(tile codes)
+
+Records are append-only, so an interrupted bake leaves a valid prefix; a
+torn trailing record is detected by its length/CRC, cut off, and the
+remaining chunks are baked on the next run.
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+import zlib
+from multiprocessing import Pool
+
+import numpy as np
+
+from .constants import CHUNK_SIZE, MASTER_SEED, TERRAIN_MODES, WAVE_TERRAIN_MODES
+from .terrain_stream import chunk_tiles
+
+MAGIC = b'MAMW'
+VERSION = 1
+HEADER = struct.Struct('<4sHHqB16s')
+RECORD = struct.Struct('<iiII')
+
+# Chunks handed to a worker per task: large enough to amortise IPC,
+# small enough to keep every core busy near the end of a bake.
+BATCH_SIZE = 16
+
+
+class BakedWorld:
+    """Read-only random access to the chunks of a baked world file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.index = {}
+
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path}: not a baked world (file too short)")
+
+        magic, version, chunk_size, master_seed, wave_mode, mode = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a baked world (bad magic or version)")
+
+        self.chunk_size = chunk_size
+        self.master_seed = master_seed
+        self.wave_mode = bool(wave_mode)
+        self.terrain_mode = mode.rstrip(b'\0').decode('ascii')
+        self.valid_end = self._scan()
+
+    def _scan(self):
+        """Index every complete record; return the offset where valid data ends."""
+        offset = HEADER.size
+        self.file.seek(offset)
+
+        while True:
+            record = self.file.read(RECORD.size)
+            if len(record) < RECORD.size:
+                return offset
+
+            chunk_x, chunk_y, length, crc = RECORD.unpack(record)
+            payload = self.file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return offset
+
+            self.index[(chunk_x, chunk_y)] = (offset + RECORD.size, length)
+            offset += RECORD.size + length
+
+    def matches(self, terrain_mode, wave_mode=False, master_seed=MASTER_SEED):
+        """True if this file can stand in for live generation with these settings."""
+        return (self.chunk_size == CHUNK_SIZE and
+                self.master_seed == master_seed and
+                self.terrain_mode == terrain_mode and
+                (self.wave_mode == bool(wave_mode) or terrain_mode not in WAVE_TERRAIN_MODES))
+
+    def __contains__(self, chunk_pos):
+        return chunk_pos in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, chunk_x, chunk_y):
+        """Return the tile-code array of a chunk, or None if it was not baked."""
+        entry = self.index.get((chunk_x, chunk_y))
+        if entry is None:
+            return None
+
+        offset, length = entry
+        self.file.seek(offset)
+        tiles = np.frombuffer(zlib.decompress(self.file.read(length)), dtype=np.uint8)
+        return tiles.reshape(self.chunk_size, self.chunk_size)
+
+    def close(self):
+        self.file.close()
+
+
+def _bake_batch(args):
+    """Worker: generate and compress a batch of chunks."""
+    chunk_positions, terrain_mode, wave_mode, master_seed = args
+    results = []
+    for chunk_x, chunk_y in chunk_positions:
+        tiles = chunk_tiles(chunk_x, chunk_y, terrain_mode, wave_mode, master_seed)
+        results.append((chunk_x, chunk_y, zlib.compress(tiles.tobytes(), 6)))
+    return results
+
+
+def _open_for_append(path, terrain_mode, wave_mode, master_seed):
+    """Open (or create) a world file and return it with the set of chunks already baked."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        out = open(path, 'wb')
+        out.write(HEADER.pack(MAGIC, VERSION, CHUNK_SIZE, master_seed, int(wave_mode),
+                              terrain_mode.encode('ascii')))
+        return out, set()
+
+    world = BakedWorld(path)
+    try:
+        if not world.matches(terrain_mode, wave_mode, master_seed):
+            raise ValueError(
+                f"{path} was baked with mode={world.terrain_mode} seed={world.master_seed} "
+                f"wave_mode={world.wave_mode} chunk_size={world.chunk_size}; refusing to mix settings"
+            )
+        done = set(world.index)
+        valid_end = world.valid_end
+    finally:
+        world.close()
+
+    out = open(path, 'r+b')
+    out.truncate(valid_end)
+    out.seek(valid_end)
+    return out, done
+
+
+def bake(path, region, terrain_mode='quantum', wave_mode=False, master_seed=MASTER_SEED,
+         workers=None, progress=True):
+    """
+    Bake every chunk in the half-open chunk rectangle `region`
+    (x0, y0, x1, y1) into `path`, resuming if the file already exists.
+    Returns the number of chunks written by this call.
+    """
+    chunk_x0, chunk_y0, chunk_x1, chunk_y1 = region
+    out, done = _open_for_append(path, terrain_mode, wave_mode, master_seed)
+
+    pending = [(x, y) for y in range(chunk_y0, chunk_y1) for x in range(chunk_x0, chunk_x1)
+               if (x, y) not in done]
+    total = len(pending)
+    batches = [(pending[i:i + BATCH_SIZE], terrain_mode, wave_mode, master_seed)
+               for i in range(0, total, BATCH_SIZE)]
+
+    if progress and done:
+        print(f"Resuming: {len(done)} chunks already baked, {total} to go", file=sys.stderr)
+
+    written = 0
+    start = time.perf_counter()
+    last_report = start
+
+    try:
+        with Pool(workers) as pool:
+            for results in pool.imap_unordered(_bake_batch, batches):
+                for chunk_x, chunk_y, payload in results:
+                    out.write(RECORD.pack(chunk_x, chunk_y, len(payload), zlib.crc32(payload)))
+                    out.write(payload)
+                out.flush()
+                written += len(results)
+
+                now = time.perf_counter()
+                if progress and (now - last_report >= 1.0 or written == total):
+                    last_report = now
+                    rate = written / (now - start)
+                    eta = (total - written) / rate if rate else 0.0
+                    print(f"\rBaked {written}/{total} chunks ({rate:.0f} chunks/s, ETA {eta:.0f}s)",
+                          end='', file=sys.stderr, flush=True)
+    finally:
+        out.close()
+        if progress and total:
+            print(file=sys.stderr)
+
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate terrain chunks into a baked world file.")
+    parser.add_argument('output', help="world file to create or resume")
+    parser.add_argument('--region', type=int, nargs=4, metavar=('X0', 'Y0', 'X1', 'Y1'),
+                        default=(-16, -16, 16, 16),
+                        help="half-open chunk rectangle to bake (default: -16 -16 16 16)")
+    parser.add_argument('--mode', choices=TERRAIN_MODES, default='quantum',
+                        help="terrain generation mode")
+    parser.add_argument('--wave-mode', action='store_true',
+                        help="bake the terrain seen while wave mode is active (quantum mode only)")
+    parser.add_argument('--seed', type=int, default=MASTER_SEED, help="master seed")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--quiet', action='store_true', help="disable progress output")
+    args = parser.parse_args(argv)
+
+    if args.wave_mode and args.mode not in WAVE_TERRAIN_MODES:
+        parser.error(f"--wave-mode has no effect in {args.mode} mode")
+
+    try:
+        bake(args.output, args.region, args.mode, args.wave_mode, master_seed=args.seed,
+             workers=args.workers, progress=not args.quiet)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Per-tile element probabilities for the table-driven ('fast_random') terrain mode.
+
+Each biome is a sequence of (element, probability) pairs, with None for
+empty ground and 'coin' for a coin on empty ground. The probabilities
+must sum to 1. A new biome is a new table here, not new code.
+"""
+from .constants import COIN_SPAWN_CHANCE
+
+# Same distribution as terrain_generation.random_terrain plus its coin draw
+FOREST = (
+    ('tree_blocks_fall', 0.35 * 0.30),
+    ('tree_oak_fall', 0.35 * 0.20),
+    ('tree_default_fall', 0.35 * 0.20),
+    ('tree_fat_fall', 0.35 * 0.15),
+    ('tree_thin_fall', 0.35 * 0.15),
+    ('stone_tall', 0.05 * 0.7),
+    ('stone_large', 0.05 * 0.3),
+    ('log', 0.03 * 0.6),
+    ('log_large', 0.03 * 0.4),
+    ('bush_small', 0.05),
+    (None, 0.52 * (1 - COIN_SPAWN_CHANCE)),
+    ('coin', 0.52 * COIN_SPAWN_CHANCE),
+)
+
+BIOMES = {
+    'forest': FOREST,
+}
+DEFAULT_BIOME = 'forest'
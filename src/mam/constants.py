@@ -0,0 +1,94 @@
+"""Game constants and configuration values."""
+from math import pi
+
+# Screen settings
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 720
+SCREEN_TITLE = "Procedural Forest Terrain - Infinite Runner"
+
+# Tile settings
+TILE_WIDTH = 128
+TILE_HEIGHT = 64
+
+# Camera movement speed
+CAMERA_SPEED = 10
+
+# Character settings
+CHARACTER_SPEED = 12
+TURN_SPEED = 0.15
+CHARACTER_SCALE = 1.0
+
+# Chunk settings
+CHUNK_SIZE = 16
+RENDER_DISTANCE = 4
+
+# Level of detail: chunks within LOD_DISTANCE of the character get full
+# sprites, farther ones a single pre-rendered impostor (see impostors.py)
+# composited at IMPOSTOR_SCALE texture pixels per world pixel
+LOD_DISTANCE = 1
+IMPOSTOR_SCALE = 1 / 8
+IMPOSTOR_CACHE_SIZE = 512
+# Impostors composited per frame; the rest wait for later frames
+IMPOSTOR_BUILD_BUDGET = 6
+
+# Zoomed-out camera (Z key) and the chunk ring it loads
+ZOOM_OUT = 0.15
+ZOOM_RENDER_DISTANCE = 5
+
+# Quality tiers, best first. The quality governor steps between them at
+# runtime to keep per-frame work under TARGET_FRAME_TIME (seconds).
+# ground_detail 1 draws per-tile grass, 0 a flat ground colour.
+QUALITY_TIERS = (
+    {'name': 'high', 'render_distance': RENDER_DISTANCE, 'particle_cap': 200, 'ground_detail': 1},
+    {'name': 'medium', 'render_distance': 3, 'particle_cap': 100, 'ground_detail': 1},
+    {'name': 'low', 'render_distance': 2, 'particle_cap': 50, 'ground_detail': 0},
+    {'name': 'minimal', 'render_distance': 1, 'particle_cap': 20, 'ground_detail': 0},
+)
+TARGET_FRAME_TIME = 1 / 60
+QUALITY_WINDOW = 60
+
+# Terrain generation modes, in the order Q cycles through them
+TERRAIN_MODES = ('quantum', 'random', 'fast_random')
+# Modes whose terrain changes while wave mode is active
+WAVE_TERRAIN_MODES = ('quantum',)
+
+# Master seed for reproducible terrain
+MASTER_SEED = 12345
+
+# Game settings
+COLLISION_PENALTY = 50
+COLLISION_COOLDOWN = 15
+
+# Quantum wave mode settings
+MAX_QUANTUM_ENERGY = 100
+QUANTUM_DRAIN_RATE = 2.5
+QUANTUM_RECHARGE_RATE = 0.1
+WAVE_MODE_ALPHA = 128
+
+# Scene layer names
+LAYER_NAME_IMPOSTORS = "Impostors"
+LAYER_NAME_CHARACTERS = "Characters"
+
+# Coin settings
+COIN_VALUE = 100
+COIN_SPAWN_CHANCE = 0.15
+
+# Audio settings: sound effect voices playing at once, and voices per sound
+AUDIO_MAX_VOICES = 8
+AUDIO_VOICES_PER_SOUND = 4
+
+# Health settings
+MAX_HEALTH = 100
+HEALTH_PENALTY = 2
+
+# Simulation timing. Per-tick values above (speeds, drain/recharge rates,
+# cooldowns) are tuned for BASE_TICK_RATE and rescaled by TICK_SCALE when
+# the fixed-step simulation runs at a different SIM_RATE.
+BASE_TICK_RATE = 60
+SIM_RATE = 60
+SIM_DT = 1 / SIM_RATE
+TICK_SCALE = BASE_TICK_RATE / SIM_RATE
+MAX_SIM_STEPS_PER_FRAME = 8
+
+# Character animation advances one frame every this many base ticks
+ANIMATION_FRAME_TICKS = 6
@@ -0,0 +1,256 @@
+"""Golden-hash determinism and throughput check for terrain generation.
+
+Usage:
+    PYTHONPATH=src python -m mam.golden                       # every engine
+    PYTHONPATH=src python -m mam.golden --engines reference cached
+    PYTHONPATH=src python -m mam.golden --update-baseline     # re-record throughput only
+    PYTHONPATH=src python -m mam.golden --update-hashes       # approve a terrain change
+
+A fixed set of chunks (GOLDEN_REGION for every seed in GOLDEN_SEEDS and
+every mode in GOLDEN_MODES) is generated by each engine. Every chunk's
+tile array is hashed and compared with the hashes committed in
+GOLDEN_PATH. Any difference means the world players know has changed.
+
+In the same run, each engine's throughput is compared with the reference
+engine and, for the reference engine, with the stored baseline. The
+baseline depends on the machine, so re-record it with --update-baseline
+where you benchmark; that refuses to run while the hashes differ.
+Exits with status 1 on any hash mismatch or on a reference throughput
+more than --tolerance below the baseline.
+
+An engine is any function (positions, terrain_mode, wave_mode,
+master_seed) -> list of tile arrays in position order. Register new
+ones (e.g. a vectorized generator) in ENGINES to prove them equivalent.
+"""
+import argparse
+import gc
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from .bake import BakedWorld, bake
+from .constants import CHUNK_SIZE
+from .headless_env import ChunkCache
+from .shared_chunks import SharedChunkCache
+from .terrain_stream import chunk_tiles
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden_terrain.json')
+
+GOLDEN_SEEDS = (12345, 1, 2024)
+# (terrain mode, wave mode)
+GOLDEN_MODES = (
+    ('quantum', False),
+    ('quantum', True),
+    ('random', False),
+    ('fast_random', False),
+)
+# Half-open chunk rectangle generated for every seed and mode
+GOLDEN_REGION = (-6, -6, 6, 6)
+
+
+def reference_engine(positions, terrain_mode, wave_mode, master_seed):
+    return [chunk_tiles(x, y, terrain_mode, wave_mode, master_seed) for x, y in positions]
+
+
+def cached_engine(positions, terrain_mode, wave_mode, master_seed):
+    cache = ChunkCache(terrain_mode, wave_mode, master_seed)
+    return [cache.get(x, y) for x, y in positions]
+
+
+def shared_engine(positions, terrain_mode, wave_mode, master_seed):
+    """Round trip through a shared-memory chunk store."""
+    shared = SharedChunkCache(capacity=len(positions), create=True, wave_mode=wave_mode)
+    try:
+        generate = lambda x, y: chunk_tiles(x, y, terrain_mode, wave_mode, master_seed)
+        return [shared.get_or_create(x, y, generate) for x, y in positions]
+    finally:
+        shared.close()
+
+
+def parallel_engine(positions, terrain_mode, wave_mode, master_seed):
+    """Bake across worker processes into a temporary world file and read it back."""
+    xs, ys = zip(*positions)
+    region = (min(xs), min(ys), max(xs) + 1, max(ys) + 1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'golden.mamw')
+        bake(path, region, terrain_mode, wave_mode, master_seed, progress=False)
+        world = BakedWorld(path)
+        try:
+            return [world.get(x, y) for x, y in positions]
+        finally:
+            world.close()
+
+
+ENGINES = {
+    'reference': reference_engine,
+    'cached': cached_engine,
+    'shared': shared_engine,
+    'parallel': parallel_engine,
+}
+
+
+def chunk_hash(tiles):
+    """Short, stable digest of a chunk's tile codes."""
+    tiles = np.ascontiguousarray(tiles, dtype=np.uint8)
+    return hashlib.sha256(tiles.tobytes()).hexdigest()[:16]
+
+
+def case_name(terrain_mode, wave_mode, master_seed):
+    return f"{terrain_mode}/wave={int(wave_mode)}/seed={master_seed}"
+
+
+def mode_label(terrain_mode, wave_mode):
+    return f"{terrain_mode}+wave" if wave_mode else terrain_mode
+
+
+def golden_cases():
+    """Yield (terrain_mode, wave_mode, master_seed) for every golden case."""
+    for terrain_mode, wave_mode in GOLDEN_MODES:
+        for master_seed in GOLDEN_SEEDS:
+            yield terrain_mode, wave_mode, master_seed
+
+
+def golden_positions(region=GOLDEN_REGION):
+    x0, y0, x1, y1 = region
+    return [(x, y) for y in range(y0, y1) for x in range(x0, x1)]
+
+
+def run_engine(engine, repeat=1, positions=None):
+    """
+    Generate every golden case with an engine, `repeat` times each.
+    Returns {case name: {"x,y": hash}} and the seconds spent per mode
+    label, counting the fastest repetition of every case.
+    """
+    positions = positions or golden_positions()
+    hashes = {}
+    seconds = {}
+    for terrain_mode, wave_mode, master_seed in golden_cases():
+        label = mode_label(terrain_mode, wave_mode)
+        fastest = float('inf')
+        for _ in range(repeat):
+            # As timeit does, keep collector pauses out of the timings
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                chunks = engine(positions, terrain_mode, wave_mode, master_seed)
+                fastest = min(fastest, time.perf_counter() - start)
+            finally:
+                gc.enable()
+        seconds[label] = seconds.get(label, 0.0) + fastest
+
+        hashes[case_name(terrain_mode, wave_mode, master_seed)] = {
+            f"{x},{y}": chunk_hash(tiles) for (x, y), tiles in zip(positions, chunks)
+        }
+    return hashes, seconds
+
+
+def compare(hashes, golden):
+    """Return {case name: [mismatched "x,y" keys]} for cases that differ from the golden hashes."""
+    mismatches = {}
+    for case, expected in golden.items():
+        actual = hashes.get(case, {})
+        wrong = [key for key, digest in expected.items() if actual.get(key) != digest]
+        if wrong:
+            mismatches[case] = wrong
+    return mismatches
+
+
+def load_golden(path=GOLDEN_PATH):
+    with open(path) as f:
+        golden = json.load(f)
+    if golden['chunk_size'] != CHUNK_SIZE:
+        raise ValueError(f"{path} was recorded with chunk size {golden['chunk_size']}, not {CHUNK_SIZE}")
+    return golden
+
+
+def throughput(seconds):
+    """Seconds per mode label -> chunks per second."""
+    chunks_per_label = len(golden_positions()) * len(GOLDEN_SEEDS)
+    return {label: round(chunks_per_label / elapsed, 1) for label, elapsed in seconds.items()}
+
+
+def save_golden(golden, path=GOLDEN_PATH):
+    golden = dict(golden, chunk_size=CHUNK_SIZE, region=list(GOLDEN_REGION))
+    with open(path, 'w') as f:
+        json.dump(golden, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check terrain output against golden hashes and throughput")
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES),
+                        help="engines to check (default: all)")
+    parser.add_argument('--golden', default=GOLDEN_PATH, help="golden hash file")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="allowed fractional slowdown of the reference engine vs the baseline")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs per case; the fastest is timed")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="re-record the reference throughput; refused while hashes differ")
+    parser.add_argument('--update-hashes', action='store_true',
+                        help="re-record the golden hashes, approving the current terrain")
+    args = parser.parse_args(argv)
+
+    if args.update_baseline or args.update_hashes:
+        hashes, seconds = run_engine(reference_engine, args.repeat)
+        if os.path.exists(args.golden):
+            golden = load_golden(args.golden)
+        else:
+            golden = {'throughput': {}, 'cases': {}}
+
+        if args.update_hashes:
+            golden['cases'] = hashes
+            print(f"Recorded {sum(len(case) for case in hashes.values())} chunk hashes to {args.golden}")
+        if args.update_baseline:
+            mismatches = compare(hashes, golden['cases'])
+            if mismatches or not golden['cases']:
+                print("Terrain differs from the golden hashes; not recording a baseline for it. "
+                      "Run with --update-hashes if the change is intended.", file=sys.stderr)
+                sys.exit(1)
+            golden['throughput'] = throughput(seconds)
+            print(f"Recorded reference throughput to {args.golden}")
+        save_golden(golden, args.golden)
+        return
+
+    golden = load_golden(args.golden)
+    chunks_per_label = len(golden_positions()) * len(GOLDEN_SEEDS)
+    case_labels = {case_name(*case): mode_label(*case[:2]) for case in golden_cases()}
+    failed = False
+    reference_rates = {}
+
+    print(f"{'engine':<10} {'mode':<14} {'mismatches':>10} {'chunks/s':>9} {'vs reference':>13} {'vs baseline':>12}")
+    # The reference engine runs first so the others can be compared with it
+    for name in sorted(args.engines, key=lambda name: name != 'reference'):
+        hashes, seconds = run_engine(ENGINES[name], args.repeat)
+        mismatches = compare(hashes, golden['cases'])
+
+        for label, elapsed in seconds.items():
+            rate = chunks_per_label / elapsed
+            wrong = sum(len(keys) for case, keys in mismatches.items() if case_labels.get(case) == label)
+            versus_reference = f"{rate / reference_rates[label]:.2f}x" if label in reference_rates else '-'
+            versus_baseline = '-'
+            if name == 'reference':
+                reference_rates[label] = rate
+                baseline = golden['throughput'].get(label)
+                if baseline:
+                    versus_baseline = f"{rate / baseline:.2f}x"
+                    if rate < baseline * (1 - args.tolerance):
+                        failed = True
+                        versus_baseline += ' SLOW'
+            print(f"{name:<10} {label:<14} {wrong:>10} {rate:>9.0f} {versus_reference:>13} {versus_baseline:>12}")
+
+        for case, keys in mismatches.items():
+            failed = True
+            print(f"  {name}: {case} differs in {len(keys)} chunks, e.g. {', '.join(keys[:5])}", file=sys.stderr)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Vectorized headless runner environment for simulating many runs at once.
+
+Every runner's state lives in NumPy arrays and all runners are stepped
+together against the terrain tile grid, sharing one chunk cache. Nothing
+here imports arcade.
+
+Collision is resolved per tile: a runner is blocked when the tile it would
+enter holds a solid element. Like PhysicsEngineSimple, the x and y moves
+are resolved separately, so runners slide along obstacles. Coins are not
+simulated.
+"""
+import os
+from collections import OrderedDict
+from math import pi
+from multiprocessing import Pool
+
+import numpy as np
+
+from .constants import (CHUNK_SIZE, MASTER_SEED, SCREEN_WIDTH, SCREEN_HEIGHT, CHARACTER_SPEED,
+                       TURN_SPEED, TICK_SCALE, COLLISION_PENALTY, COLLISION_COOLDOWN,
+                       MAX_QUANTUM_ENERGY, QUANTUM_DRAIN_RATE, QUANTUM_RECHARGE_RATE,
+                       MAX_HEALTH, HEALTH_PENALTY, WAVE_TERRAIN_MODES)
+from .shared_chunks import SharedChunkCache
+from .terrain_stream import chunk_tiles, COLLISION_MASK
+from .utils import screen_to_iso
+
+
+class ChunkCache:
+    """
+    LRU cache of generated chunk tile arrays with vectorized tile lookups.
+    One cache can be shared by any number of environments. With `shared`
+    (a SharedChunkCache), misses are first served from chunks other
+    processes already generated; it must hold the same wave-mode variant.
+    """
+
+    def __init__(self, terrain_mode='quantum', wave_mode=False, master_seed=MASTER_SEED, max_chunks=4096,
+                 shared=None):
+        if shared is not None and terrain_mode in WAVE_TERRAIN_MODES and shared.wave_mode != bool(wave_mode):
+            raise ValueError(f"shared chunk cache {shared.name!r} holds wave_mode={shared.wave_mode} "
+                             f"terrain, not wave_mode={bool(wave_mode)}")
+        self.terrain_mode = terrain_mode
+        self.wave_mode = wave_mode
+        self.master_seed = master_seed
+        self.max_chunks = max_chunks
+        self.shared = shared
+        self.chunks = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, chunk_x, chunk_y):
+        """Return the tile array of a chunk, generating it on a miss."""
+        chunk_pos = (chunk_x, chunk_y)
+        tiles = self.chunks.get(chunk_pos)
+        if tiles is not None:
+            self.hits += 1
+            self.chunks.move_to_end(chunk_pos)
+            return tiles
+
+        self.misses += 1
+        tiles = self.generate(chunk_x, chunk_y)
+        self.chunks[chunk_pos] = tiles
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return tiles
+
+    def generate(self, chunk_x, chunk_y):
+        if self.shared is not None:
+            return self.shared.get_or_create(chunk_x, chunk_y, self._generate)
+        return self._generate(chunk_x, chunk_y)
+
+    def _generate(self, chunk_x, chunk_y):
+        return chunk_tiles(chunk_x, chunk_y, self.terrain_mode, self.wave_mode, self.master_seed)
+
+    def tile_codes(self, tile_x, tile_y):
+        """Look up the tile code at each (tile_x[i], tile_y[i]) integer position."""
+        chunk_x, local_x = np.divmod(tile_x, CHUNK_SIZE)
+        chunk_y, local_y = np.divmod(tile_y, CHUNK_SIZE)
+
+        keys, inverse = np.unique(np.stack([chunk_x, chunk_y]), axis=1, return_inverse=True)
+        stack = np.stack([self.get(int(x), int(y)) for x, y in keys.T])
+        return stack[inverse.ravel(), local_x, local_y]
+
+
+def screen_to_tile(screen_x, screen_y):
+    """Vectorized screen position -> nearest integer tile coordinates."""
+    iso_x, iso_y = screen_to_iso(screen_x, screen_y)
+    return np.floor(iso_x + 0.5).astype(np.int64), np.floor(iso_y + 0.5).astype(np.int64)
+
+
+class HeadlessRunnerEnv:
+    """
+    N independent runners stepped in lockstep, one simulation step (SIM_DT) per call.
+
+    State arrays (length N): x, y (screen space, like the game), direction,
+    energy, health, cooldown (ticks), penalty, wave (wave mode active),
+    wave_requested (last step's wave request) and alive. Dead runners stay
+    in place.
+    """
+
+    def __init__(self, n_agents, terrain_mode='quantum', master_seed=MASTER_SEED, cache=None):
+        self.n_agents = n_agents
+        self.cache = cache if cache is not None else ChunkCache(terrain_mode, master_seed=master_seed)
+        self.reset()
+
+    def reset(self):
+        n = self.n_agents
+        self.start_x = SCREEN_WIDTH / 2
+        self.start_y = SCREEN_HEIGHT / 2
+        self.x = np.full(n, self.start_x)
+        self.y = np.full(n, self.start_y)
+        self.direction = np.full(n, pi / 4)
+        self.energy = np.full(n, float(MAX_QUANTUM_ENERGY))
+        self.health = np.full(n, MAX_HEALTH, dtype=np.int64)
+        self.cooldown = np.zeros(n, dtype=np.int64)
+        self.penalty = np.zeros(n, dtype=np.int64)
+        self.wave = np.zeros(n, dtype=bool)
+        self.wave_requested = np.zeros(n, dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+        self.steps = 0
+
+    def solid(self, screen_x, screen_y):
+        """True where the tile under each screen position is an obstacle."""
+        return COLLISION_MASK[self.cache.tile_codes(*screen_to_tile(screen_x, screen_y))]
+
+    def step(self, turn, wave):
+        """
+        Advance every runner by one simulation step.
+        turn: per-runner -1/0/1 (as turn_direction in the game);
+        wave: per-runner bool, True while wave mode is requested (W held).
+        Returns a bool array of runners that collided this tick.
+        """
+        alive = self.alive
+        self.cooldown[self.cooldown > 0] -= 1
+
+        # Quantum energy, same rules as the game: wave mode starts on a fresh
+        # request with energy left and ends on release or when drained.
+        # Holding the request after a drain recharges instead of re-entering.
+        requested = np.asarray(wave, dtype=bool)
+        pressed = requested & ~self.wave_requested
+        self.wave = requested & alive & (self.wave | (pressed & (self.energy > 0)))
+        self.wave_requested = requested.copy()
+        self.energy = np.where(self.wave, self.energy - QUANTUM_DRAIN_RATE * TICK_SCALE,
+                               np.minimum(self.energy + QUANTUM_RECHARGE_RATE * TICK_SCALE, MAX_QUANTUM_ENERGY))
+        drained = self.wave & (self.energy <= 0)
+        self.energy[drained] = 0
+        self.wave &= ~drained
+
+        self.direction = np.where(alive, self.direction + np.asarray(turn) * TURN_SPEED * TICK_SCALE,
+                                  self.direction)
+        change_x = np.cos(self.direction) * CHARACTER_SPEED * TICK_SCALE * alive
+        change_y = np.sin(self.direction) * CHARACTER_SPEED * TICK_SCALE * alive
+
+        # Resolve x then y, wave-mode runners pass through everything
+        solid_check = alive & ~self.wave
+        blocked_x = solid_check & self.solid(self.x + change_x, self.y)
+        self.x = np.where(blocked_x, self.x, self.x + change_x)
+        blocked_y = solid_check & self.solid(self.x, self.y + change_y)
+        self.y = np.where(blocked_y, self.y, self.y + change_y)
+
+        collided = (blocked_x | blocked_y) & (self.cooldown == 0)
+        self.penalty[collided] -= COLLISION_PENALTY
+        self.cooldown[collided] = round(COLLISION_COOLDOWN / TICK_SCALE)
+        self.health[collided] = np.maximum(0, self.health[collided] - HEALTH_PENALTY)
+        self.alive &= self.health > 0
+
+        self.steps += 1
+        return collided
+
+    @property
+    def displacement(self):
+        return np.hypot(self.x - self.start_x, self.y - self.start_y)
+
+    @property
+    def score(self):
+        return self.displacement.astype(np.int64) + self.penalty
+
+
+class RandomPolicy:
+    """Picklable baseline policy: sticky random turns and occasional wave mode."""
+
+    def __init__(self, seed=0, turn_change=0.05, wave_chance=0.02):
+        self.rng = np.random.default_rng(seed)
+        self.turn_change = turn_change
+        self.wave_chance = wave_chance
+        self.turn = None
+
+    def __call__(self, env):
+        if self.turn is None or len(self.turn) != env.n_agents:
+            self.turn = np.zeros(env.n_agents, dtype=np.int64)
+        change = self.rng.random(env.n_agents) < self.turn_change
+        self.turn[change] = self.rng.integers(-1, 2, size=int(change.sum()))
+        wave = self.rng.random(env.n_agents) < self.wave_chance
+        return self.turn, wave
+
+
+def rollout(env, policy, steps):
+    """Run `policy` (callable env -> (turn, wave)) for `steps` ticks or until all runners die."""
+    for _ in range(steps):
+        if not env.alive.any():
+            break
+        env.step(*policy(env))
+    return env
+
+
+def _run_shard(args):
+    n_agents, steps, terrain_mode, master_seed, policy_seed, shared_name = args
+    shared = SharedChunkCache(shared_name) if shared_name else None
+    cache = ChunkCache(terrain_mode, master_seed=master_seed, shared=shared)
+    env = HeadlessRunnerEnv(n_agents, cache=cache)
+    try:
+        rollout(env, RandomPolicy(policy_seed), steps)
+    finally:
+        if shared is not None:
+            shared.close()
+    return {
+        'score': env.score,
+        'health': env.health,
+        'alive': env.alive,
+        'steps': env.steps,
+        'chunks': len(env.cache.chunks),
+    }
+
+
+def run_sharded(n_agents, steps, processes=None, terrain_mode='quantum', master_seed=MASTER_SEED, seed=0,
+                share_chunks=False):
+    """
+    Simulate n_agents random-policy runners split across a process pool,
+    each process with its own environment and chunk cache. With
+    share_chunks, the processes also share one SharedChunkCache so each
+    chunk is generated once in total. Returns the concatenated per-runner
+    score, health and alive arrays.
+    """
+    shard_count = processes or os.cpu_count() or 1
+    sizes = [len(part) for part in np.array_split(np.arange(n_agents), shard_count) if len(part)]
+    shared = SharedChunkCache(capacity=4096, create=True) if share_chunks else None
+
+    try:
+        with Pool(len(sizes)) as pool:
+            shards = pool.map(_run_shard, [(size, steps, terrain_mode, master_seed, seed + i,
+                                            shared.name if shared else None)
+                                           for i, size in enumerate(sizes)])
+    finally:
+        if shared is not None:
+            shared.close()
+
+    return {key: np.concatenate([shard[key] for shard in shards]) for key in ('score', 'health', 'alive')}
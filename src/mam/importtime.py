@@ -0,0 +1,105 @@
+"""Import-time breakdown: how long each module takes to import and what it pulls in.
+
+Usage:
+    PYTHONPATH=src python -m mam.importtime                  # every mam module
+    PYTHONPATH=src python -m mam.importtime mam.bake --top 10
+    PYTHONPATH=src python -m mam.importtime --check          # fail if the core loads graphics
+
+Every module is imported in a fresh interpreter under -X importtime, so a
+result never depends on what was imported before it. Interpreter startup
+imports are left out.
+"""
+import argparse
+import os
+import pkgutil
+import subprocess
+import sys
+from collections import defaultdict
+
+import mam
+
+# Packages the core modules must not import
+GRAPHICS_PACKAGES = ('arcade', 'pyglet')
+
+# Modules that open the game window; everything else in mam is core
+RENDER_MODULES = ('mam.render.game',)
+
+
+def core_modules():
+    """All modules directly in the mam package, except entry points."""
+    return [f"mam.{info.name}" for info in pkgutil.iter_modules(mam.__path__)
+            if not info.ispkg and info.name not in ('__main__', 'importtime')]
+
+
+def parse_importtime(stderr):
+    """-X importtime output -> list of (name, depth, self_us, cumulative_us)."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        try:
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue  # column header
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, self_us, cumulative_us))
+    return entries
+
+
+def measure(module, python=sys.executable):
+    """Import `module` in a fresh interpreter; returns its total seconds and seconds per top-level package."""
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.abspath(mam.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [src, env.get('PYTHONPATH')]))
+    result = subprocess.run([python, '-X', 'importtime', '-c', f"import {module}"],
+                            capture_output=True, text=True, env=env)
+    if result.returncode:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    entries = parse_importtime(result.stderr)
+    # Everything before the first import of our root package is interpreter startup
+    root = module.split('.')[0]
+    start = next(i for i, entry in enumerate(entries) if entry[0].split('.')[0] == root)
+    entries = entries[start:]
+
+    packages = defaultdict(float)
+    for name, _, self_us, _ in entries:
+        packages[name.split('.')[0]] += self_us / 1e6
+    total = sum(cumulative_us for _, depth, _, cumulative_us in entries if depth == 0) / 1e6
+    return total, dict(packages)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Break down mam import times by package")
+    parser.add_argument('modules', nargs='*', help="modules to measure (default: all mam modules)")
+    parser.add_argument('--top', type=int, default=5, help="packages listed per module")
+    parser.add_argument('--repeat', type=int, default=3, help="imports per module; the fastest is reported")
+    parser.add_argument('--check', action='store_true',
+                        help=f"exit with status 1 if a core module imports {' or '.join(GRAPHICS_PACKAGES)}")
+    args = parser.parse_args(argv)
+
+    core = core_modules()
+    modules = args.modules or core + list(RENDER_MODULES)
+
+    leaks = []
+    print(f"{'module':<24} {'total ms':>9}  heaviest packages (ms)")
+    for module in modules:
+        total, packages = min((measure(module) for _ in range(args.repeat)), key=lambda run: run[0])
+        heaviest = sorted(packages.items(), key=lambda item: -item[1])[:args.top]
+        print(f"{module:<24} {total * 1000:>9.1f}  " +
+              ", ".join(f"{name} {seconds * 1000:.1f}" for name, seconds in heaviest))
+
+        graphics = [name for name in GRAPHICS_PACKAGES if name in packages]
+        if graphics and module in core:
+            leaks.append(f"{module} imports {', '.join(graphics)}")
+
+    for leak in leaks:
+        print(f"core module {leak}", file=sys.stderr)
+    if args.check and leaks:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
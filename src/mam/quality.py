@@ -0,0 +1,88 @@
+"""Adaptive quality governor that trades detail for frame time."""
+from collections import deque
+
+from .constants import QUALITY_TIERS, TARGET_FRAME_TIME, QUALITY_WINDOW
+
+
+class QualityGovernor:
+    """
+    Watches a rolling window of frame times and steps through quality
+    tiers (best first) to stay under a target frame time.
+
+    Hysteresis keeps it from oscillating: quality drops when the window
+    average exceeds target * downgrade_ratio, but only rises when it falls
+    below target * upgrade_ratio, and the window is refilled after every
+    change. Raising quality also needs upgrade_delay full windows of
+    headroom, because a cheap tier always looks fast.
+    """
+
+    def __init__(self, tiers=QUALITY_TIERS, target=TARGET_FRAME_TIME, window=QUALITY_WINDOW,
+                 downgrade_ratio=1.1, upgrade_ratio=0.6, upgrade_delay=3):
+        self.tiers = tiers
+        self.target = target
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.upgrade_delay = upgrade_delay
+
+        self.frame_times = deque(maxlen=window)
+        self.tier_index = 0
+        self.frame = 0
+        self.windows_under = 0
+        self.decisions = deque(maxlen=100)
+
+    @property
+    def tier(self):
+        """The current quality tier."""
+        return self.tiers[self.tier_index]
+
+    @property
+    def average(self):
+        """Mean frame time over the current window, in seconds."""
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    def record(self, frame_time):
+        """
+        Add one frame's time. Returns the new tier if quality changed,
+        otherwise None.
+        """
+        self.frame += 1
+        self.frame_times.append(frame_time)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return None
+
+        average = self.average
+        if average > self.target * self.downgrade_ratio:
+            self.windows_under = 0
+            if self.tier_index < len(self.tiers) - 1:
+                return self._change(self.tier_index + 1, average, "over budget")
+        elif average < self.target * self.upgrade_ratio:
+            self.windows_under += 1
+            self.frame_times.clear()
+            if self.windows_under >= self.upgrade_delay and self.tier_index > 0:
+                return self._change(self.tier_index - 1, average, "headroom")
+        else:
+            self.windows_under = 0
+        return None
+
+    def _change(self, tier_index, average, reason):
+        self.decisions.append({
+            'frame': self.frame,
+            'from': self.tier['name'],
+            'to': self.tiers[tier_index]['name'],
+            'frame_time': average,
+            'reason': reason,
+        })
+        self.tier_index = tier_index
+        self.windows_under = 0
+        self.frame_times.clear()
+        return self.tier
+
+    def report(self):
+        """One-line summary of the current tier and the last decision."""
+        line = (f"Quality: {self.tier['name']} (avg {self.average * 1000:.2f} ms, "
+                f"target {self.target * 1000:.2f} ms, {len(self.decisions)} changes)")
+        if self.decisions:
+            last = self.decisions[-1]
+            line += (f"; last {last['from']} -> {last['to']} at frame {last['frame']} "
+                     f"({last['reason']}, {last['frame_time'] * 1000:.2f} ms)")
+        return line
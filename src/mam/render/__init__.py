@@ -0,0 +1 @@
+"""Game window, sprites, HUD and audio; importing any of these loads arcade and pyglet."""
@@ -0,0 +1,140 @@
+"""Animation clips loaded once and shared by every sprite that plays them.
+
+A clip is a list of frame textures, a frame duration and one hitbox that
+covers the opaque pixels of every frame. The frames get that hitbox when
+they are created, so no image is scanned for hit box points and a sprite's
+collision shape stays the same from frame to frame.
+"""
+import arcade
+from PIL import Image
+
+from ..constants import BASE_TICK_RATE, ANIMATION_FRAME_TICKS
+
+# Seconds each frame is shown
+FRAME_DURATION = ANIMATION_FRAME_TICKS / BASE_TICK_RATE
+
+# Clip name -> frame image paths, in playback order
+CLIP_FRAMES = {
+    'idle': [
+        "assets/characters/character2_idle/character_1-5.png",
+        "assets/characters/character2_idle/character_2-4.png",
+        "assets/characters/character2_idle/character_3-4.png",
+        "assets/characters/character2_idle/character_4-4.png",
+        "assets/characters/character2_idle/character_5-4.png",
+        "assets/characters/character2_idle/character_6-4.png",
+        "assets/characters/character2_idle/character_7-4.png",
+        "assets/characters/character2_idle/character_8-5.png",
+    ],
+    'forward': [
+        "assets/characters/character2_run/character_1-4.png",
+        "assets/characters/character2_run/character_2-3.png",
+        "assets/characters/character2_run/character_3-3.png",
+        "assets/characters/character2_run/character_4-3.png",
+        "assets/characters/character2_run/character_5-3.png",
+        "assets/characters/character2_run/character_6-3.png",
+        "assets/characters/character2_run/character_7-3.png",
+        "assets/characters/character2_run/character_8-4.png",
+    ],
+    'left': [
+        "assets/characters/character2_left/character_1-9.png",
+        "assets/characters/character2_left/character_2-8.png",
+        "assets/characters/character2_left/character_3-8.png",
+        "assets/characters/character2_left/character_4-8.png",
+        "assets/characters/character2_left/character_5-8.png",
+        "assets/characters/character2_left/character_6-8.png",
+        "assets/characters/character2_left/character_7-8.png",
+        "assets/characters/character2_left/character_8-9.png",
+    ],
+    'right': [
+        "assets/characters/character2_right/character_1-8.png",
+        "assets/characters/character2_right/character_2-7.png",
+        "assets/characters/character2_right/character_3-7.png",
+        "assets/characters/character2_right/character_4-7.png",
+        "assets/characters/character2_right/character_5-7.png",
+        "assets/characters/character2_right/character_6-7.png",
+        "assets/characters/character2_right/character_7-7.png",
+        "assets/characters/character2_right/character_8-8.png",
+    ],
+}
+
+# Clip to play instead when a clip has no loadable frames
+CLIP_FALLBACKS = {
+    'forward': 'idle',
+    'left': 'forward',
+    'right': 'forward',
+}
+
+# Loaded clips by name, shared across sprites and restarts
+_clips = {}
+
+
+class AnimationClip:
+    """Frame textures sharing one hitbox, played at a fixed frame duration."""
+
+    def __init__(self, name, textures, hit_box_points, frame_duration=FRAME_DURATION):
+        self.name = name
+        self.textures = textures
+        self.hit_box_points = hit_box_points
+        self.frame_duration = frame_duration
+
+    def __len__(self):
+        return len(self.textures)
+
+    def frame_index(self, elapsed):
+        """Index of the frame showing `elapsed` seconds into the looping clip."""
+        return int(elapsed / self.frame_duration) % len(self.textures)
+
+
+def union_hit_box(images):
+    """Bounding box of the opaque pixels of all images, as points relative to the image centre."""
+    left = top = float('inf')
+    right = bottom = float('-inf')
+    for image in images:
+        box = image.getchannel('A').getbbox()
+        if box is None:
+            continue
+        # Relative to the centre, y up, as arcade hit box points are
+        half_width = image.width / 2
+        half_height = image.height / 2
+        left = min(left, box[0] - half_width)
+        right = max(right, box[2] - half_width)
+        top = min(top, box[1] - half_height)
+        bottom = max(bottom, box[3] - half_height)
+
+    if left == float('inf'):
+        return None
+    return ((left, -bottom), (right, -bottom), (right, -top), (left, -top))
+
+
+def load_clip(name, paths, frame_duration=FRAME_DURATION):
+    """Load a clip's frames; frames that fail to load are skipped. Returns None if none load."""
+    images = []
+    for path in paths:
+        try:
+            images.append((path, Image.open(path).convert('RGBA')))
+        except Exception as e:
+            print(f"Could not load {path}: {e}")
+    if not images:
+        return None
+
+    hit_box_points = union_hit_box([image for _, image in images])
+    textures = [arcade.Texture(image, hit_box_points=hit_box_points, hash=f"clip:{path}")
+                for path, image in images]
+    return AnimationClip(name, textures, textures[0].hit_box_points, frame_duration)
+
+
+def get_clip(name):
+    """Return a loaded clip by name, loading it on first use."""
+    clip = _clips.get(name)
+    if clip is not None:
+        return clip
+
+    clip = load_clip(name, CLIP_FRAMES.get(name, ()))
+    if clip is None:
+        if name in CLIP_FALLBACKS:
+            clip = get_clip(CLIP_FALLBACKS[name])
+        else:
+            texture = arcade.make_soft_square_texture(32, arcade.color.BLUE, 255, 255)
+            clip = AnimationClip(name, [texture], texture.hit_box_points)
+    _clips[name] = clip
+    return clip
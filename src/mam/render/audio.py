@@ -0,0 +1,145 @@
+"""Sound effect mixer with a bounded, reused set of voices.
+
+Every sound gets a fixed pool of pyglet players (voices) created up front
+and reused for every playback, so no players are created while the game
+runs. Requests made during a simulation tick are coalesced, so a sound
+starts at most once per flush() however many times it was requested. At
+most max_voices effects play at once; past that, the voice that started
+the longest ago is cut off and reused.
+"""
+from pyglet import media
+
+from ..constants import AUDIO_MAX_VOICES, AUDIO_VOICES_PER_SOUND
+
+
+class SoundPool:
+    """Reusable voices for one sound."""
+
+    def __init__(self, sound, voices=AUDIO_VOICES_PER_SOUND, volume=1.0):
+        self.sound = sound
+        self.volume = volume
+        self.voices = [media.Player() for _ in range(voices)]
+        # Voice -> play serial it was last started with; lower is older
+        self.started = {}
+
+        self.pending = None
+        self.requests = 0
+        self.plays = 0
+        self.coalesced = 0
+        self.steals = 0
+
+    def is_active(self, voice):
+        return voice.playing and voice.source is not None
+
+    def active_voices(self):
+        return [voice for voice in self.voices if self.is_active(voice)]
+
+    def request(self, volume=None):
+        """Ask for a playback at the next flush; repeats before then are merged."""
+        volume = self.volume if volume is None else volume
+        self.requests += 1
+        if self.pending is None:
+            self.pending = volume
+        else:
+            self.coalesced += 1
+            self.pending = max(self.pending, volume)
+
+    def idle_voice(self):
+        for voice in self.voices:
+            if not self.is_active(voice):
+                return voice
+        return None
+
+    def start(self, voice, volume, serial):
+        """(Re)start the sound on a voice from the beginning."""
+        if voice.source is None:
+            voice.queue(self.sound.source)
+        else:
+            voice.seek(0)
+        voice.volume = volume
+        voice.play()
+        self.started[voice] = serial
+        self.plays += 1
+
+    def stop(self):
+        for voice in self.voices:
+            voice.pause()
+        self.pending = None
+
+
+class AudioMixer:
+    """Sound pools sharing one cap on concurrently playing voices."""
+
+    def __init__(self, max_voices=AUDIO_MAX_VOICES):
+        self.max_voices = max_voices
+        self.pools = {}
+        self.serial = 0
+        self.peak_voices = 0
+
+    def add(self, name, sound, voices=AUDIO_VOICES_PER_SOUND, volume=1.0):
+        """Register a sound under a name with its own pool of voices."""
+        if sound is None:
+            return None
+        self.pools[name] = SoundPool(sound, voices, volume)
+        return self.pools[name]
+
+    def play(self, name, volume=None):
+        """Request a sound for the next flush(); unknown names are ignored."""
+        pool = self.pools.get(name)
+        if pool is not None:
+            pool.request(volume)
+
+    def active_voices(self):
+        return sum(len(pool.active_voices()) for pool in self.pools.values())
+
+    def flush(self):
+        """Start this tick's requested sounds, stealing the oldest voices when over the cap."""
+        for pool in self.pools.values():
+            if pool.pending is None:
+                continue
+            volume, pool.pending = pool.pending, None
+
+            voice = pool.idle_voice()
+            if voice is None:
+                # Every voice of this sound is busy: restart its oldest
+                _, voice = self._oldest([pool])
+                pool.steals += 1
+            elif self.active_voices() >= self.max_voices:
+                # Over the cap: cut off the oldest voice of any sound
+                victim_pool, victim = self._oldest(self.pools.values())
+                victim.pause()
+                victim_pool.steals += 1
+
+            self.serial += 1
+            pool.start(voice, volume, self.serial)
+
+        self.peak_voices = max(self.peak_voices, self.active_voices())
+
+    def _oldest(self, pools):
+        """(pool, voice) of the playing voice started longest ago among `pools`."""
+        candidates = [(pool.started[voice], pool, voice) for pool in pools for voice in pool.active_voices()]
+        _, pool, voice = min(candidates, key=lambda item: item[0])
+        return pool, voice
+
+    def stop(self):
+        for pool in self.pools.values():
+            pool.stop()
+
+    def stats(self):
+        """Voice counts and playback totals, overall and per sound."""
+        return {
+            'active': self.active_voices(),
+            'peak': self.peak_voices,
+            'max': self.max_voices,
+            'sounds': {
+                name: {
+                    'voices': len(pool.voices),
+                    'active': len(pool.active_voices()),
+                    'requests': pool.requests,
+                    'plays': pool.plays,
+                    'coalesced': pool.coalesced,
+                    'steals': pool.steals,
+                }
+                for name, pool in self.pools.items()
+            },
+        }
@@ -0,0 +1,66 @@
+"""Character sprite with animations and wave mode."""
+import arcade
+from ..constants import CHARACTER_SCALE, WAVE_MODE_ALPHA
+from .animation import get_clip
+
+
+class Character(arcade.Sprite):
+    """Character with animation support"""
+
+    def __init__(self):
+        super().__init__()
+
+        # Shared clips, loaded once for all characters
+        self.clips = {name: get_clip(name) for name in ('idle', 'forward', 'left', 'right')}
+
+        # Animation state
+        self.current_animation = "forward"
+        self.clip = self.clips[self.current_animation]
+        self.clip_time = 0.0
+
+        # Set initial texture and the clip's fixed hitbox
+        self.texture = self.clip.textures[0]
+        self.scale = CHARACTER_SCALE
+        self.hit_box = arcade.hitbox.HitBox(self.clip.hit_box_points, self.position, self.scale)
+
+        # Movement direction (in radians)
+        self.direction = 0
+
+        # Isometric position tracking
+        self.iso_x = 0
+        self.iso_y = 0
+
+        # Wave mode state
+        self.in_wave_mode = False
+
+    def update_animation(self, delta_time=1 / 60, turn_direction=0):
+        """Update character animation based on movement direction and elapsed time"""
+        # Determine which animation to use
+        if turn_direction > 0:
+            target_animation = "left"
+        elif turn_direction < 0:
+            target_animation = "right"
+        else:
+            target_animation = "forward"
+
+        # Restart the clip if animation changed
+        if target_animation != self.current_animation:
+            self.current_animation = target_animation
+            self.clip = self.clips[target_animation]
+            self.clip_time = 0.0
+            self.hit_box = arcade.hitbox.HitBox(self.clip.hit_box_points, self.position, self.scale)
+        else:
+            self.clip_time += delta_time
+
+        # Only touch the texture when the frame actually changes
+        texture = self.clip.textures[self.clip.frame_index(self.clip_time)]
+        if texture is not self.texture:
+            self.texture = texture
+
+    def set_wave_mode(self, enabled):
+        """Toggle wave mode visual effect"""
+        self.in_wave_mode = enabled
+        if enabled:
+            self.alpha = WAVE_MODE_ALPHA
+        else:
+            self.alpha = 255
\ No newline at end of file
@@ -0,0 +1,739 @@
+"""Main game loop and window management."""
+import time
+import math
+import random
+import arcade
+import numpy as np
+from math import pi, cos, sin
+
+from ..constants import (SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, CHARACTER_SPEED, TURN_SPEED,
+                         CHUNK_SIZE, RENDER_DISTANCE, LOD_DISTANCE, IMPOSTOR_BUILD_BUDGET,
+                         ZOOM_OUT, ZOOM_RENDER_DISTANCE, QUALITY_TIERS, TICK_SCALE,
+                         COLLISION_PENALTY, COLLISION_COOLDOWN, MAX_QUANTUM_ENERGY,
+                         QUANTUM_DRAIN_RATE, QUANTUM_RECHARGE_RATE, COIN_VALUE,
+                         MAX_HEALTH, HEALTH_PENALTY, LAYER_NAME_IMPOSTORS,
+                         LAYER_NAME_CHARACTERS, TERRAIN_MODES, WAVE_TERRAIN_MODES)
+from .character import Character
+from .hud import Hud
+from ..timestep import FixedTimestep, lerp
+from ..quality import QualityGovernor
+from .minimap import Minimap
+from .impostors import ImpostorCache
+from .audio import AudioMixer
+from ..shared_chunks import open_shared_cache
+from ..terrain_stream import chunk_tiles, TILE_ELEMENTS, TILE_COIN
+from ..utils import (iso_to_screen, screen_to_iso, screen_to_chunk,
+                   get_hitbox_for_element, has_collision)
+
+
+class ProceduralForestTerrain(arcade.Window):
+    def __init__(self, baked_worlds=(), share_chunks=False):
+        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+        arcade.set_background_color(arcade.color.SKY_BLUE)
+
+        # Camera setup
+        self.camera = arcade.camera.Camera2D()
+
+        # Scene to manage all sprites
+        self.scene = None
+
+        # Load textures
+        self.textures = {}
+
+        # Store active chunks
+        self.chunks = {}
+
+        # Single-sprite stand-ins for chunks beyond LOD_DISTANCE
+        self.impostors = None
+        self.zoomed_out = False
+
+        # Runtime quality governor and the settings of its current tier
+        self.quality = QualityGovernor()
+        self.render_distance = RENDER_DISTANCE
+        self.particle_cap = QUALITY_TIERS[0]['particle_cap']
+        self.ground_detail = QUALITY_TIERS[0]['ground_detail']
+        self.frame_work_time = 0.0
+
+        # Pre-generated chunks (see bake.py), used instead of live generation
+        # by whichever file matches the current terrain and wave mode
+        self.baked_worlds = list(baked_worlds)
+
+        # Chunk stores shared with other processes, one per terrain mode
+        self.share_chunks = share_chunks
+        self.shared_chunks = {}
+
+        # Character
+        self.character = None
+
+        # Physics engine
+        self.physics_engine = None
+
+        # Fixed-step simulation clock and the state rendering interpolates from
+        self.timestep = FixedTimestep()
+        self.prev_character_pos = (0, 0)
+        self.prev_camera_pos = (0, 0)
+
+        # Turn direction
+        self.turn_direction = 0
+
+        # Terrain generation mode
+        self.terrain_mode = 'quantum'
+
+        # Game state
+        self.game_over = False
+        self.score = 0
+        self.penalty = 0
+        self.displacement = 0
+        self.start_x = 0
+        self.start_y = 0
+        self.collision_cooldown = 0
+
+        # Quantum wave mode state
+        self.wave_mode_active = False
+        self.quantum_energy = MAX_QUANTUM_ENERGY
+        self.wave_particles = []
+
+        # HUD and its widgets
+        self.hud = None
+        self.energy_bar = None
+        self.score_text = None
+        self.displacement_text = None
+        self.energy_label = None
+        self.collision_text = None
+        self.wave_text = None
+        self.controls_text = None
+        self.game_over_text = None
+        self.final_score_text = None
+        self.restart_text = None
+        self.health_label = None
+
+        # Overview map drawn from chunk tile data
+        self.minimap = None
+        self.show_minimap = True
+
+        # Health
+        self.health = MAX_HEALTH
+        self.last_damage_time = 0
+
+        # Audio
+        self.bg_ambient_music = None
+        self.coin_music = None
+        self.running_music = None
+        self.bg_player = None
+        self.running_player = None
+        self.mixer = AudioMixer()
+
+    def load_textures(self):
+        """Load all forest-themed textures"""
+        try:
+            self.textures['grass'] = arcade.load_texture("assets/terrain/ground_grass_NE.png")
+            self.textures['tree_blocks_fall'] = arcade.load_texture("assets/terrain/tree_blocks_fall_NE.png")
+            self.textures['tree_default_fall'] = arcade.load_texture("assets/terrain/tree_default_fall_NE.png")
+            self.textures['tree_fat_fall'] = arcade.load_texture("assets/terrain/tree_fat_fall_NE.png")
+            self.textures['tree_thin_fall'] = arcade.load_texture("assets/terrain/tree_thin_fall_NE.png")
+            self.textures['tree_oak_fall'] = arcade.load_texture("assets/terrain/tree_oak_fall_NE.png")
+            self.textures['stone_tall'] = arcade.load_texture("assets/terrain/stone_tallG_NE.png")
+            self.textures['stone_large'] = arcade.load_texture("assets/terrain/stone_largeC_NE.png")
+            self.textures['bush_small'] = arcade.load_texture("assets/terrain/plant_bushSmall_NE.png")
+            self.textures['log'] = arcade.load_texture("assets/terrain/log_NE.png")
+            self.textures['log_large'] = arcade.load_texture("assets/terrain/log_large_NE.png")
+            self.textures['coin'] = arcade.load_texture("assets/terrain/skull-fotor-bg-remover-2025110325712.png")
+        except Exception as e:
+            print(f"Error loading textures: {e}")
+            self.textures['grass'] = arcade.load_texture(":resources:images/tiles/grassCenter.png")
+
+    def setup(self):
+        """Set up initial scene, chunks and character"""
+        self.scene = arcade.Scene()
+        self.chunks = {}
+        self.load_textures()
+        if self.impostors is None:
+            self.impostors = ImpostorCache(self.textures)
+
+        # Load audio once; loops keep playing across restarts
+        if self.bg_player is None:
+            self.bg_ambient_music = arcade.load_sound("assets/music/bg.mp3")
+            self.coin_music = arcade.load_sound("assets/music/coin_collect.mp3")
+            self.running_music = arcade.load_sound("assets/music/running.mp3")
+            self.mixer.add('coin', self.coin_music, volume=0.1)
+
+            self.bg_player = arcade.play_sound(self.bg_ambient_music, volume=1, loop=True)
+            self.running_player = arcade.play_sound(self.running_music, volume=0.2, loop=True)
+
+        # Add sprite lists for different layers. Full-detail chunks keep
+        # their own ground, object, wall and coin lists (see create_chunk).
+        self.scene.add_sprite_list(LAYER_NAME_IMPOSTORS)
+        self.scene.add_sprite_list(LAYER_NAME_CHARACTERS)
+
+        # Create character
+        self.character = Character()
+        self.character.center_x = SCREEN_WIDTH / 2
+        self.character.center_y = SCREEN_HEIGHT / 2
+        self.character.iso_x = 0
+        self.character.iso_y = 0
+        self.character.direction = pi / 4
+
+        self.start_x = self.character.center_x
+        self.start_y = self.character.center_y
+        self.prev_character_pos = self.character.position
+        self.prev_camera_pos = self.camera.position
+        self.timestep.reset()
+
+        self.scene.add_sprite(LAYER_NAME_CHARACTERS, self.character)
+
+        self.minimap = Minimap(self.ctx, self.chunk_tiles)
+
+        # Initialize physics engine; chunks add their wall lists to it
+        self.physics_engine = arcade.PhysicsEngineSimple(self.character)
+
+        # Generate initial chunks
+        self.update_chunks()
+
+        # Reset game state
+        self.game_over = False
+        self.score = 0
+        self.penalty = 0
+        self.displacement = 0
+        self.collision_cooldown = 0
+        self.wave_mode_active = False
+        self.quantum_energy = MAX_QUANTUM_ENERGY
+        self.wave_particles = []
+        self.health = MAX_HEALTH
+        self.last_damage_time = 0
+
+        # Initialize UI text objects
+        self._init_ui_text()
+
+    def _init_ui_text(self):
+        """Initialize all UI widgets in a single retained-mode HUD"""
+        self.hud = Hud()
+
+        self.score_text = self.hud.text(
+            "Score: {}", 10, SCREEN_HEIGHT - 30,
+            arcade.color.WHITE, 20, value=0, bold=True
+        )
+
+        self.displacement_text = self.hud.text(
+            "Displacement: {}", 10, SCREEN_HEIGHT - 60,
+            arcade.color.LIGHT_GRAY, 16, value=0
+        )
+
+        self.energy_bar = self.hud.bar(
+            10, SCREEN_HEIGHT - 110, 200, 20,
+            arcade.color.DARK_GRAY, arcade.color.WHITE, 2
+        )
+
+        self.energy_label = self.hud.text(
+            "Quantum Energy: {}%",
+            10, SCREEN_HEIGHT - 140,
+            arcade.color.CYAN, 14, value=MAX_QUANTUM_ENERGY, bold=True
+        )
+
+        self.collision_text = self.hud.text(
+            f"COLLISION! -{COLLISION_PENALTY}",
+            SCREEN_WIDTH / 2, SCREEN_HEIGHT - 40,
+            arcade.color.RED, 24,
+            anchor_x="center", bold=True
+        )
+
+        self.wave_text = self.hud.text(
+            "⚛ WAVE MODE ACTIVE ⚛",
+            SCREEN_WIDTH / 2, SCREEN_HEIGHT - 80,
+            arcade.color.CYAN, 20,
+            anchor_x="center", bold=True
+        )
+
+        self.controls_text = self.hud.text(
+            "LEFT/A: Turn Left  |  RIGHT/D: Turn Right  |  HOLD W: Wave Mode  |  Q: Toggle Terrain  |  M: Map  |  Z: Zoom",
+            10, 10,
+            arcade.color.WHITE, 14
+        )
+
+        self.game_over_text = self.hud.text(
+            "GAME OVER!",
+            SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 30,
+            arcade.color.RED, 60,
+            anchor_x="center", bold=True
+        )
+
+        self.final_score_text = self.hud.text(
+            "Final Score: {}",
+            SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 30,
+            arcade.color.WHITE, 30, value=0,
+            anchor_x="center", bold=True
+        )
+
+        self.restart_text = self.hud.text(
+            "Press R to Restart",
+            SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 70,
+            arcade.color.WHITE, 24,
+            anchor_x="center"
+        )
+
+        self.health_label = self.hud.text(
+            "Health: {}%",
+            10, SCREEN_HEIGHT - 170,
+            arcade.color.LIGHT_GREEN, 14, value=MAX_HEALTH, bold=True
+        )
+
+    @property
+    def terrain_variant(self):
+        """What chunk_tiles currently generates: terrain mode, and wave mode where it matters"""
+        return self.terrain_mode, self.wave_mode_active and self.terrain_mode in WAVE_TERRAIN_MODES
+
+    def chunk_tiles(self, chunk_x, chunk_y):
+        """Get a chunk's tile codes, from the baked world when it covers this chunk"""
+        for baked_world in self.baked_worlds:
+            if baked_world.matches(self.terrain_mode, self.wave_mode_active):
+                tiles = baked_world.get(chunk_x, chunk_y)
+                if tiles is not None:
+                    return tiles
+
+        if self.share_chunks and not self.wave_mode_active:
+            if self.terrain_mode not in self.shared_chunks:
+                self.shared_chunks[self.terrain_mode] = open_shared_cache(self.terrain_mode)
+            # A copy, so other processes evicting the block cannot change it mid-build
+            return self.shared_chunks[self.terrain_mode].get_or_create(
+                chunk_x, chunk_y,
+                lambda x, y: chunk_tiles(x, y, self.terrain_mode)
+            )
+
+        return chunk_tiles(chunk_x, chunk_y, self.terrain_mode, self.wave_mode_active)
+
+    def create_chunk(self, chunk_x, chunk_y):
+        """
+        Create a chunk's sprites in sprite lists of its own, so unloading it
+        drops whole lists instead of removing sprites one by one from
+        shared ones (SpriteList.remove is O(len(list)) per sprite)
+        """
+        tiles = self.chunk_tiles(chunk_x, chunk_y)
+        self.minimap.add_chunk(chunk_x, chunk_y, tiles, self.terrain_variant)
+
+        start_tile_x = chunk_x * CHUNK_SIZE
+        start_tile_y = chunk_y * CHUNK_SIZE
+
+        chunk_sprites = {
+            'ground': arcade.SpriteList(),
+            'objects': arcade.SpriteList(),
+            'walls': arcade.SpriteList(use_spatial_hash=True),
+            'coins': arcade.SpriteList(use_spatial_hash=True)
+        }
+
+        for (x, y), code in np.ndenumerate(tiles):
+            tile_x = start_tile_x + x
+            tile_y = start_tile_y + y
+            element = TILE_ELEMENTS[code] if code != TILE_COIN else None
+            screen_x, screen_y = iso_to_screen(tile_x, tile_y)
+
+            # Create ground sprite
+            grass_sprite = arcade.Sprite()
+            grass_sprite.texture = self.textures['grass']
+            grass_sprite.center_x = screen_x
+            grass_sprite.center_y = screen_y
+            grass_sprite.scale = 0.5
+            chunk_sprites['ground'].append(grass_sprite)
+
+            if element and element in self.textures:
+                detail_sprite = arcade.Sprite()
+                detail_sprite.texture = self.textures[element]
+                detail_sprite.center_x = screen_x
+                detail_sprite.center_y = screen_y
+                detail_sprite.scale = 0.4
+                detail_sprite.iso_x = tile_x
+                detail_sprite.iso_y = tile_y
+
+                if has_collision(element):
+                    hitbox_points = get_hitbox_for_element(element)
+                    detail_sprite.hit_box = arcade.hitbox.HitBox(
+                        hitbox_points,
+                        position=(detail_sprite.center_x, detail_sprite.center_y)
+                    )
+                    chunk_sprites['walls'].append(detail_sprite)
+                else:
+                    chunk_sprites['objects'].append(detail_sprite)
+
+            if code == TILE_COIN:
+                coin_sprite = arcade.Sprite()
+                coin_sprite.texture = self.textures['coin']
+                coin_sprite.center_x = screen_x
+                coin_sprite.center_y = screen_y + 10
+                coin_sprite.scale = 0.1
+                chunk_sprites['coins'].append(coin_sprite)
+
+        self.physics_engine.walls.append(chunk_sprites['walls'])
+        return chunk_sprites
+
+    def create_impostor(self, chunk_x, chunk_y, build=True):
+        """Add a chunk's impostor to the scene; returns None if it is not cached and build is False"""
+        variant = self.terrain_variant
+        sprite = self.impostors.get(chunk_x, chunk_y, variant)
+        if sprite is None:
+            if not build:
+                return None
+            tiles = self.chunk_tiles(chunk_x, chunk_y)
+            self.minimap.add_chunk(chunk_x, chunk_y, tiles, variant)
+            sprite = self.impostors.build(chunk_x, chunk_y, tiles, variant)
+
+        self.scene.add_sprite(LAYER_NAME_IMPOSTORS, sprite)
+        return {'impostors': [sprite]}
+
+    def remove_chunk(self, chunk_pos):
+        chunk = self.chunks.pop(chunk_pos)
+        if 'impostors' in chunk:
+            for sprite in chunk['impostors']:
+                sprite.remove_from_sprite_lists()
+        else:
+            self.physics_engine.walls.remove(chunk['walls'])
+
+    def chunk_layers(self, layer):
+        """The given sprite list ('ground', 'objects', 'walls' or 'coins') of every full-detail chunk"""
+        return [chunk[layer] for chunk in self.chunks.values() if layer in chunk]
+
+    def update_chunks(self):
+        """
+        Update chunks around the character: full sprites within LOD_DISTANCE,
+        impostors beyond it, nearest first
+        """
+        center_chunk_x, center_chunk_y = screen_to_chunk(
+            self.character.center_x,
+            self.character.center_y
+        )
+        render_distance = self.render_distance
+        if self.zoomed_out:
+            render_distance = max(render_distance, ZOOM_RENDER_DISTANCE)
+
+        chunks_needed = {}
+        for dx in range(-render_distance, render_distance + 1):
+            for dy in range(-render_distance, render_distance + 1):
+                distance = max(abs(dx), abs(dy))
+                chunks_needed[(center_chunk_x + dx, center_chunk_y + dy)] = distance
+
+        # Remove far chunks
+        chunks_to_remove = [pos for pos in self.chunks.keys() if pos not in chunks_needed]
+        for chunk_pos in chunks_to_remove:
+            self.remove_chunk(chunk_pos)
+
+        # Create new chunks and swap detail levels. A chunk keeps its full
+        # sprites until its impostor is ready, so nothing blinks out.
+        builds = self.impostors.builds
+        impostors_added = False
+        for chunk_pos, distance in sorted(chunks_needed.items(), key=lambda item: item[1]):
+            full = distance <= LOD_DISTANCE
+            chunk = self.chunks.get(chunk_pos)
+            if chunk is not None and ('impostors' not in chunk) == full:
+                continue
+
+            if full:
+                new_chunk = self.create_chunk(*chunk_pos)
+            else:
+                new_chunk = self.create_impostor(
+                    *chunk_pos, build=self.impostors.builds - builds < IMPOSTOR_BUILD_BUDGET
+                )
+                if new_chunk is None:
+                    continue
+                impostors_added = True
+
+            if chunk is not None:
+                self.remove_chunk(chunk_pos)
+            self.chunks[chunk_pos] = new_chunk
+
+        # Farther (higher) impostors first, so nearer ones overlap them
+        if impostors_added:
+            self.scene[LAYER_NAME_IMPOSTORS].sort(key=lambda sprite: -sprite.center_y)
+
+    def on_key_press(self, key, modifiers):
+        """Handle key press"""
+        if self.game_over:
+            if key == arcade.key.R:
+                self.setup()
+            return
+
+        if key == arcade.key.LEFT or key == arcade.key.A:
+            self.turn_direction = -1
+        elif key == arcade.key.RIGHT or key == arcade.key.D:
+            self.turn_direction = 1
+        elif key == arcade.key.W:
+            if self.quantum_energy > 0:
+                self.wave_mode_active = True
+                self.character.set_wave_mode(True)
+        elif key == arcade.key.Q:
+            next_mode = (TERRAIN_MODES.index(self.terrain_mode) + 1) % len(TERRAIN_MODES)
+            self.terrain_mode = TERRAIN_MODES[next_mode]
+            print(f"Switched to {self.terrain_mode.replace('_', ' ').title()} Terrain Generation")
+        elif key == arcade.key.F3:
+            print(self.hud.report())
+            print(self.quality.report())
+            for mode, shared in self.shared_chunks.items():
+                print(f"Shared chunks ({mode}): {shared.stats()}")
+            print(f"Minimap: {self.minimap.uploads} chunk uploads")
+            print(f"Audio: {self.mixer.stats()}")
+            print(f"Impostors: {len(self.scene[LAYER_NAME_IMPOSTORS])} drawn, "
+                  f"{len(self.impostors.impostors)} cached, {self.impostors.builds} built")
+        elif key == arcade.key.Z:
+            self.zoomed_out = not self.zoomed_out
+            self.camera.zoom = ZOOM_OUT if self.zoomed_out else 1.0
+        elif key == arcade.key.M:
+            self.show_minimap = not self.show_minimap
+
+    def on_key_release(self, key, modifiers):
+        """Handle key release"""
+        if key == arcade.key.LEFT or key == arcade.key.A:
+            if self.turn_direction == -1:
+                self.turn_direction = 0
+        elif key == arcade.key.RIGHT or key == arcade.key.D:
+            if self.turn_direction == 1:
+                self.turn_direction = 0
+        elif key == arcade.key.W:
+            self.wave_mode_active = False
+            self.character.set_wave_mode(False)
+
+    def update_wave_particles(self):
+        """Update quantum wave visual effect particles"""
+        if self.wave_mode_active and len(self.wave_particles) < self.particle_cap and \
+                random.random() < 0.3 * TICK_SCALE:
+            angle = random.uniform(0, 2 * pi)
+            distance = random.uniform(10, 30)
+            self.wave_particles.append({
+                'x': self.character.center_x + cos(angle) * distance,
+                'y': self.character.center_y + sin(angle) * distance,
+                'life': 30,
+                'size': random.uniform(3, 8),
+                'color': random.choice([
+                    arcade.color.CYAN,
+                    arcade.color.LIGHT_BLUE,
+                    arcade.color.ELECTRIC_BLUE,
+                    arcade.color.SKY_BLUE
+                ])
+            })
+
+        self.wave_particles = [p for p in self.wave_particles if p['life'] > 0]
+        for particle in self.wave_particles:
+            particle['life'] -= TICK_SCALE
+
+    def take_damage(self, amount: int):
+        """Reduce health, trigger Game Over if needed"""
+        self.health = max(0, self.health - amount)
+        self.last_damage_time = time.time()
+
+        if self.health <= 0:
+            self.game_over = True
+            self.wave_mode_active = False
+
+    def apply_quality_tier(self, tier):
+        """Switch render distance, particle cap and ground detail to a quality tier"""
+        self.render_distance = tier['render_distance']
+        self.particle_cap = tier['particle_cap']
+        self.ground_detail = tier['ground_detail']
+        del self.wave_particles[self.particle_cap:]
+
+        if self.ground_detail:
+            arcade.set_background_color(arcade.color.SKY_BLUE)
+        else:
+            arcade.set_background_color(arcade.color.DARK_PASTEL_GREEN)
+
+    def on_update(self, delta_time):
+        """Run as many fixed simulation steps as the elapsed time calls for"""
+        if self.game_over:
+            return
+
+        start = time.perf_counter()
+        for _ in range(self.timestep.advance(delta_time)):
+            self.simulation_step(self.timestep.step)
+            if self.game_over:
+                break
+
+        self.update_chunks()
+        if self.show_minimap:
+            self.minimap.update(*screen_to_iso(self.character.center_x, self.character.center_y),
+                                self.terrain_variant)
+        self.frame_work_time += time.perf_counter() - start
+
+    def simulation_step(self, dt):
+        """Advance the game by one fixed step of dt seconds"""
+        self.prev_character_pos = self.character.position
+        self.prev_camera_pos = self.camera.position
+
+        if self.collision_cooldown > 0:
+            self.collision_cooldown -= 1
+
+        # Update quantum energy
+        if self.wave_mode_active:
+            self.quantum_energy -= QUANTUM_DRAIN_RATE * TICK_SCALE
+            if self.quantum_energy <= 0:
+                self.quantum_energy = 0
+                self.wave_mode_active = False
+                self.character.set_wave_mode(False)
+        else:
+            self.quantum_energy = min(self.quantum_energy + QUANTUM_RECHARGE_RATE * TICK_SCALE,
+                                      MAX_QUANTUM_ENERGY)
+
+        self.update_wave_particles()
+
+        # Update character direction
+        if self.turn_direction != 0:
+            self.character.direction += self.turn_direction * TURN_SPEED * TICK_SCALE
+
+        # Move forward
+        self.character.change_x = math.cos(self.character.direction) * CHARACTER_SPEED * TICK_SCALE
+        self.character.change_y = math.sin(self.character.direction) * CHARACTER_SPEED * TICK_SCALE
+
+        old_x = self.character.center_x
+        old_y = self.character.center_y
+
+        # Update physics
+        if not self.wave_mode_active:
+            self.physics_engine.update()
+        else:
+            self.character.center_x += self.character.change_x
+            self.character.center_y += self.character.change_y
+
+        # Check collision
+        if not self.wave_mode_active:
+            actual_move_x = self.character.center_x - old_x
+            actual_move_y = self.character.center_y - old_y
+
+            if abs(actual_move_x) < abs(self.character.change_x) * 0.5 or \
+                    abs(actual_move_y) < abs(self.character.change_y) * 0.5:
+                if self.collision_cooldown == 0:
+                    self.penalty -= COLLISION_PENALTY
+                    self.collision_cooldown = round(COLLISION_COOLDOWN / TICK_SCALE)
+                    self.take_damage(HEALTH_PENALTY)
+
+        # Calculate displacement
+        self.displacement = math.sqrt(
+            (self.character.center_x - self.start_x) ** 2 +
+            (self.character.center_y - self.start_y) ** 2
+        )
+
+        self.score = int(self.displacement) + self.penalty
+
+        # Update camera
+        move_x = self.character.center_x - old_x
+        move_y = self.character.center_y - old_y
+        current_pos = self.camera.position
+        self.camera.position = (current_pos[0] + move_x, current_pos[1] + move_y)
+
+        self.character.update_animation(dt, self.turn_direction)
+
+        # Coin collection
+        coin_hits = arcade.check_for_collision_with_lists(
+            self.character,
+            self.chunk_layers('coins')
+        )
+        for coin in coin_hits:
+            self.mixer.play('coin')
+            coin.remove_from_sprite_lists()
+            self.score += COIN_VALUE
+
+        # Pickups this step share one playback
+        self.mixer.flush()
+
+    def on_draw(self):
+        """Render the world between the last two simulation steps, then the UI"""
+        start = time.perf_counter()
+        self.clear()
+
+        # Interpolate the character and camera for rendering only
+        alpha = self.timestep.alpha
+        character_pos = self.character.position
+        camera_pos = self.camera.position
+        self.character.position = (lerp(self.prev_character_pos[0], character_pos[0], alpha),
+                                   lerp(self.prev_character_pos[1], character_pos[1], alpha))
+        self.camera.position = (lerp(self.prev_camera_pos[0], camera_pos[0], alpha),
+                                lerp(self.prev_camera_pos[1], camera_pos[1], alpha))
+        try:
+            self._draw_world()
+        finally:
+            self.character.position = character_pos
+            self.camera.position = camera_pos
+
+        # Draw UI
+        arcade.camera.Camera2D().use()
+        self._update_hud()
+        self.hud.draw()
+        if self.show_minimap:
+            self.minimap.draw()
+
+        # Feed this frame's update + draw cost to the quality governor
+        self.frame_work_time += time.perf_counter() - start
+        if not self.game_over:
+            tier = self.quality.record(self.frame_work_time)
+            if tier is not None:
+                decision = self.quality.decisions[-1]
+                print(f"Quality {decision['from']} -> {decision['to']} "
+                      f"({decision['reason']}, {decision['frame_time'] * 1000:.1f} ms/frame)")
+                self.apply_quality_tier(tier)
+        self.frame_work_time = 0.0
+
+    def _draw_world(self):
+        """Draw terrain, objects, characters and particles through the world camera"""
+        self.camera.use()
+
+        # Draw layers
+        self.scene[LAYER_NAME_IMPOSTORS].draw()
+        if self.ground_detail:
+            for sprite_list in self.chunk_layers('ground'):
+                sprite_list.draw()
+        for sprite_list in self.chunk_layers('objects'):
+            sprite_list.draw()
+
+        # Sort dynamic objects
+        dynamic_objects = []
+        for sprite_list in self.chunk_layers('walls') + self.chunk_layers('coins'):
+            dynamic_objects.extend(sprite_list)
+        dynamic_objects.extend(self.scene[LAYER_NAME_CHARACTERS])
+        dynamic_objects.sort(key=lambda s: -s.center_y)
+
+        sprite_list = arcade.SpriteList(use_spatial_hash=True)
+        sprite_list.extend(dynamic_objects)
+        sprite_list.draw()
+
+        # Draw wave particles
+        for particle in self.wave_particles:
+            alpha = int((particle['life'] / 30) * 200)
+            color = (*particle['color'][:3], alpha)
+            arcade.draw_circle_filled(
+                particle['x'],
+                particle['y'],
+                particle['size'],
+                color
+            )
+
+    def _update_hud(self):
+        """Push current game state into the HUD; widgets ignore unchanged values"""
+        with self.hud.updating():
+            self.score_text.set(self.score)
+            self.displacement_text.set(int(self.displacement))
+
+            self.energy_bar.set(
+                self.quantum_energy / MAX_QUANTUM_ENERGY,
+                arcade.color.CYAN if self.quantum_energy > 20 else arcade.color.RED
+            )
+            self.energy_label.set(int(self.quantum_energy))
+            self.energy_label.set_color(arcade.color.YELLOW if self.wave_mode_active else arcade.color.CYAN)
+
+            self.health_label.set(int(self.health))
+            if time.time() - self.last_damage_time < 0.3:
+                self.health_label.set_color(arcade.color.RED)
+            else:
+                self.health_label.set_color(arcade.color.LIGHT_GREEN)
+
+            self.collision_text.set_visible(self.collision_cooldown > 0)
+            self.wave_text.set_visible(self.wave_mode_active)
+
+            self.final_score_text.set(self.score)
+            self.game_over_text.set_visible(self.game_over)
+            self.final_score_text.set_visible(self.game_over)
+            self.restart_text.set_visible(self.game_over)
+
+
+def run(baked_worlds=(), share_chunks=False):
+    """Open the game window and run until it is closed"""
+    window = ProceduralForestTerrain(baked_worlds, share_chunks)
+    try:
+        window.setup()
+        arcade.run()
+    finally:
+        # Segments this process created are destroyed here
+        for shared in window.shared_chunks.values():
+            shared.close()
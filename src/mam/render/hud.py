@@ -0,0 +1,138 @@
+"""Retained-mode HUD: widgets that only touch pyglet when their value changes."""
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import arcade
+import pyglet
+from pyglet.shapes import Box, Rectangle
+
+# Number of frames averaged in the cost report
+REPORT_WINDOW = 120
+
+
+class HudText:
+    """
+    Text widget bound to a value. The format string is only applied, and
+    the glyphs only re-laid out, when the value actually changes.
+    """
+
+    def __init__(self, hud, fmt, x, y, color, font_size, value=None, **kwargs):
+        self.hud = hud
+        self.fmt = fmt
+        self._color = arcade.types.Color.from_iterable(color)
+        self._visible = True
+        self.text = arcade.Text(
+            fmt.format(value), x, y,
+            self._color, font_size,
+            batch=hud.batch, group=hud.foreground, **kwargs
+        )
+        self.value = value
+
+    def set(self, value):
+        """Show a new value; no-op if it is unchanged."""
+        if value == self.value:
+            return
+        self.value = value
+        self.text.text = self.fmt.format(value)
+        self.hud.text_updates += 1
+
+    def set_color(self, color):
+        if color == self._color:
+            return
+        self._color = color
+        self.text.color = color
+        self.hud.text_updates += 1
+
+    def set_visible(self, visible):
+        if visible == self._visible:
+            return
+        self._visible = visible
+        self.text.visible = visible
+        self.hud.text_updates += 1
+
+
+class HudBar:
+    """Horizontal fill bar whose geometry is only rebuilt when the fill changes."""
+
+    def __init__(self, hud, left, bottom, width, height, background, outline, outline_width=2):
+        self.hud = hud
+        self.width = width
+        self.fill_width = None
+        self._color = None
+
+        self.background = Rectangle(left, bottom, width, height, color=background,
+                                    batch=hud.batch, group=hud.background)
+        self.fill = Rectangle(left, bottom, width, height,
+                              batch=hud.batch, group=hud.middleground)
+        self.outline = Box(left, bottom, width, height, thickness=outline_width, color=outline,
+                           batch=hud.batch, group=hud.foreground)
+
+    def set(self, fraction, color):
+        """Set fill as a 0-1 fraction; geometry is touched only on a whole-pixel change."""
+        fill_width = round(max(0.0, min(1.0, fraction)) * self.width)
+        if fill_width != self.fill_width:
+            self.fill_width = fill_width
+            self.fill.width = fill_width
+            self.hud.geometry_updates += 1
+        if color != self._color:
+            self._color = color
+            self.fill.color = color
+            self.hud.geometry_updates += 1
+
+
+class Hud:
+    """
+    All HUD widgets share a single pyglet batch, so the whole HUD is drawn
+    with one call. Per-frame update/draw costs are recorded for report().
+    """
+
+    def __init__(self):
+        self.batch = pyglet.graphics.Batch()
+        self.background = pyglet.graphics.Group(order=0)
+        self.middleground = pyglet.graphics.Group(order=1)
+        self.foreground = pyglet.graphics.Group(order=2)
+
+        self.text_updates = 0
+        self.geometry_updates = 0
+        self.update_time = 0.0
+
+        # (text updates, geometry updates, update seconds, draw seconds) per frame
+        self.history = deque(maxlen=REPORT_WINDOW)
+
+    def text(self, fmt, x, y, color, font_size, value=None, **kwargs):
+        return HudText(self, fmt, x, y, color, font_size, value, **kwargs)
+
+    def bar(self, left, bottom, width, height, background, outline, outline_width=2):
+        return HudBar(self, left, bottom, width, height, background, outline, outline_width)
+
+    @contextmanager
+    def updating(self):
+        """Wrap widget updates for one frame so their cost is recorded."""
+        self.text_updates = 0
+        self.geometry_updates = 0
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.update_time = time.perf_counter() - start
+
+    def draw(self):
+        start = time.perf_counter()
+        self.batch.draw()
+        draw_time = time.perf_counter() - start
+        self.history.append((self.text_updates, self.geometry_updates, self.update_time, draw_time))
+
+    def report(self):
+        """Summarise HUD cost over the last REPORT_WINDOW frames."""
+        if not self.history:
+            return "HUD: no frames drawn yet"
+
+        frames = len(self.history)
+        dirty = sum(1 for text, geometry, _, _ in self.history if text or geometry)
+        text = sum(entry[0] for entry in self.history)
+        geometry = sum(entry[1] for entry in self.history)
+        update_ms = sum(entry[2] for entry in self.history) / frames * 1000
+        draw_ms = sum(entry[3] for entry in self.history) / frames * 1000
+        return (f"HUD over {frames} frames: {dirty} dirty, {text} text updates, "
+                f"{geometry} geometry updates, {update_ms:.3f} ms update, {draw_ms:.3f} ms draw per frame")
@@ -0,0 +1,105 @@
+"""Pre-rendered impostors that stand in for distant chunks.
+
+A far chunk is drawn as one sprite whose texture is the chunk's ground and
+obstacles composited with PIL at IMPOSTOR_SCALE, instead of the few hundred
+sprites create_chunk makes for it. Coins are left out: they are collected
+up close, where chunks have full sprites.
+
+Impostors are kept in an LRU cache, so a chunk is composited once while it
+stays in or near view. An evicted texture leaves the sprite atlas as soon
+as no sprite uses it.
+"""
+from collections import OrderedDict
+from math import ceil
+
+import arcade
+import numpy as np
+from PIL import Image
+
+from ..constants import CHUNK_SIZE, IMPOSTOR_SCALE, IMPOSTOR_CACHE_SIZE
+from ..terrain_stream import TILE_ELEMENTS, TILE_COIN
+from ..utils import iso_to_screen
+
+# Sprite scales used by create_chunk
+GROUND_SCALE = 0.5
+DETAIL_SCALE = 0.4
+
+
+class ImpostorCache:
+    """
+    Builds and caches one impostor sprite per chunk. `variant` tells apart
+    different contents of the same chunk, e.g. terrain mode and wave mode.
+    """
+
+    def __init__(self, textures, scale=IMPOSTOR_SCALE, max_impostors=IMPOSTOR_CACHE_SIZE):
+        self.scale = scale
+        self.max_impostors = max_impostors
+        self.impostors = OrderedDict()
+        self.builds = 0
+
+        # Source images shrunk once to impostor resolution
+        self.images = {}
+        for name, texture in textures.items():
+            layer_scale = GROUND_SCALE if name == 'grass' else DETAIL_SCALE
+            size = (max(1, round(texture.width * layer_scale * scale)),
+                    max(1, round(texture.height * layer_scale * scale)))
+            self.images[name] = texture.image.convert('RGBA').resize(size, Image.LANCZOS)
+
+    def get(self, chunk_x, chunk_y, variant=None):
+        """Return the cached impostor sprite for a chunk, or None."""
+        key = (chunk_x, chunk_y, variant)
+        sprite = self.impostors.get(key)
+        if sprite is not None:
+            self.impostors.move_to_end(key)
+        return sprite
+
+    def build(self, chunk_x, chunk_y, tiles, variant=None):
+        """Composite a chunk's impostor from its tile codes and cache it."""
+        image, center_x, center_y = self.composite(chunk_x, chunk_y, tiles)
+        texture = arcade.Texture(image, hit_box_algorithm=arcade.hitbox.algo_bounding_box)
+        sprite = arcade.Sprite(texture, scale=1 / self.scale, center_x=center_x, center_y=center_y)
+
+        self.impostors[(chunk_x, chunk_y, variant)] = sprite
+        if len(self.impostors) > self.max_impostors:
+            self.impostors.popitem(last=False)
+        self.builds += 1
+        return sprite
+
+    def composite(self, chunk_x, chunk_y, tiles):
+        """
+        Draw a chunk's grass and detail sprites into one image, in the same
+        order the scene draws them. Returns the image and the world position
+        of its centre.
+        """
+        start_tile_x = chunk_x * CHUNK_SIZE
+        start_tile_y = chunk_y * CHUNK_SIZE
+        grass = self.images.get('grass')
+
+        ground = []
+        details = []
+        for (x, y), code in np.ndenumerate(tiles):
+            screen_x, screen_y = iso_to_screen(start_tile_x + x, start_tile_y + y)
+            if grass is not None:
+                ground.append((screen_x, screen_y, grass))
+            element = TILE_ELEMENTS[code] if code != TILE_COIN else None
+            if element in self.images:
+                details.append((screen_x, screen_y, self.images[element]))
+
+        # Back to front, like the depth-sorted wall layer
+        details.sort(key=lambda item: -item[1])
+        layers = ground + details
+
+        # Bounds in impostor pixels, y up
+        left = min(x * self.scale - image.width / 2 for x, _, image in layers)
+        right = max(x * self.scale + image.width / 2 for x, _, image in layers)
+        bottom = min(y * self.scale - image.height / 2 for _, y, image in layers)
+        top = max(y * self.scale + image.height / 2 for _, y, image in layers)
+
+        width = ceil(right - left)
+        height = ceil(top - bottom)
+        canvas = Image.new('RGBA', (width, height))
+        for x, y, image in layers:
+            canvas.alpha_composite(image, dest=(round(x * self.scale - image.width / 2 - left),
+                                                round(top - y * self.scale - image.height / 2)))
+
+        return canvas, (left + width / 2) / self.scale, (top - height / 2) / self.scale
@@ -0,0 +1,182 @@
+"""Sprite-free minimap rasterized straight from chunk tile codes.
+
+Every chunk becomes a CHUNK_SIZE x CHUNK_SIZE pixel block through a NumPy
+colour lookup, one texel per tile. Blocks are written into a wrapping
+(toroidal) texture at their chunk coordinates modulo the texture size, so
+the map scrolls without moving any data. Only chunks new to the texture
+are uploaded, and drawing is one textured quad. The fragment shader
+applies the isometric projection so the map matches the screen.
+
+Blocks are tagged with the variant of the terrain they show (any
+hashable, e.g. terrain mode and wave mode, as for impostors), so
+switching variants re-rasterizes the view instead of keeping stale tiles.
+"""
+from math import sqrt
+
+import numpy as np
+from arcade.gl import geometry
+
+from ..constants import CHUNK_SIZE, TILE_WIDTH, TILE_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+from ..terrain_stream import TILE_ELEMENTS
+
+# Chunks per side of the wrapping texture; must exceed the viewed diameter
+MINIMAP_CHUNKS = 32
+# Chunks rasterized ahead of the runner around it, nearest first
+MINIMAP_VIEW_CHUNKS = 10
+# Chunks generated for the minimap per frame
+MINIMAP_CHUNK_BUDGET = 4
+MINIMAP_SIZE = 220
+
+MINIMAP_COLORS = {
+    None: (84, 140, 62, 255),
+    'tree_blocks_fall': (28, 82, 34, 255),
+    'tree_default_fall': (28, 82, 34, 255),
+    'tree_fat_fall': (24, 72, 30, 255),
+    'tree_thin_fall': (36, 94, 40, 255),
+    'tree_oak_fall': (30, 78, 28, 255),
+    'tree_tall_fall': (28, 82, 34, 255),
+    'tree_thin': (98, 150, 70, 255),
+    'stone_tall': (128, 128, 136, 255),
+    'stone_large': (150, 150, 158, 255),
+    'log': (120, 82, 46, 255),
+    'log_large': (106, 70, 38, 255),
+    'bush_small': (110, 170, 80, 255),
+    'coin': (250, 210, 60, 255),
+}
+TRAIL_COLOR = (230, 60, 60, 255)
+
+# COLOR_LUT[code] is the RGBA texel for a tile code
+COLOR_LUT = np.array([MINIMAP_COLORS[name] for name in TILE_ELEMENTS], dtype=np.uint8)
+
+VERTEX_SHADER = """
+#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+uniform sampler2D u_map;
+uniform vec2 u_center;          // runner position in tiles
+uniform float u_radius;         // tiles from the map centre to its edge
+uniform float u_aspect;         // TILE_WIDTH / TILE_HEIGHT
+uniform float u_texture_size;   // texels per side
+in vec2 v_uv;
+out vec4 f_color;
+void main() {
+    vec2 offset = v_uv * 2.0 - 1.0;
+    float r = length(offset);
+    if (r > 1.0) discard;
+    if (r > 0.97) { f_color = vec4(1.0); return; }
+    if (r < 0.035) { f_color = vec4(1.0); return; }
+
+    // Inverse isometric projection of the screen-aligned offset
+    vec2 tile = u_center + u_radius * 0.5 *
+        vec2(offset.x + u_aspect * offset.y, u_aspect * offset.y - offset.x);
+    vec4 color = texture(u_map, (floor(tile + 0.5) + 0.5) / u_texture_size);
+    f_color = color.a > 0.0 ? color : vec4(0.08, 0.08, 0.1, 0.85);
+}
+"""
+
+
+def rasterize_chunk(tiles):
+    """Tile codes indexed [x, y] -> RGBA block indexed [row=y, column=x]."""
+    return np.ascontiguousarray(COLOR_LUT[tiles.T])
+
+
+class Minimap:
+    """Scrolling overview of chunk tile data, drawn as one textured quad."""
+
+    def __init__(self, ctx, chunk_source, left=SCREEN_WIDTH - MINIMAP_SIZE - 10,
+                 bottom=SCREEN_HEIGHT - MINIMAP_SIZE - 10, size=MINIMAP_SIZE):
+        self.ctx = ctx
+        self.chunk_source = chunk_source
+        self.texture_size = MINIMAP_CHUNKS * CHUNK_SIZE
+        self.texture = ctx.texture((self.texture_size, self.texture_size), components=4,
+                                   filter=(ctx.NEAREST, ctx.NEAREST),
+                                   wrap_x=ctx.REPEAT, wrap_y=ctx.REPEAT)
+        self.texture.write(bytes(self.texture_size * self.texture_size * 4))
+
+        # Which chunk, and variant of it, currently occupies each texture slot
+        self.slot_owner = {}
+        self.complete_center = None
+        self.trail_tile = None
+        self.uploads = 0
+
+        self.program = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+        self.program['u_map'] = 0
+        # Scale so the farthest tile shown is MINIMAP_VIEW_CHUNKS chunks away
+        aspect = TILE_WIDTH / TILE_HEIGHT
+        self.program['u_radius'] = MINIMAP_VIEW_CHUNKS * CHUNK_SIZE * 2 / sqrt(1 + aspect ** 2)
+        self.program['u_aspect'] = aspect
+        self.program['u_texture_size'] = self.texture_size
+
+        # Quad in normalised device coordinates
+        width = size / SCREEN_WIDTH * 2
+        height = size / SCREEN_HEIGHT * 2
+        center_x = (left + size / 2) / SCREEN_WIDTH * 2 - 1
+        center_y = (bottom + size / 2) / SCREEN_HEIGHT * 2 - 1
+        self.quad = geometry.quad_2d(size=(width, height), pos=(center_x, center_y))
+        self.center = (0.0, 0.0)
+
+    def _slot(self, chunk_x, chunk_y):
+        return chunk_x % MINIMAP_CHUNKS, chunk_y % MINIMAP_CHUNKS
+
+    def has_chunk(self, chunk_x, chunk_y, variant=None):
+        return self.slot_owner.get(self._slot(chunk_x, chunk_y)) == (chunk_x, chunk_y, variant)
+
+    def add_chunk(self, chunk_x, chunk_y, tiles, variant=None):
+        """Upload a chunk's block unless that chunk and variant are already in its slot."""
+        slot = self._slot(chunk_x, chunk_y)
+        if self.slot_owner.get(slot) == (chunk_x, chunk_y, variant):
+            return
+        self.slot_owner[slot] = (chunk_x, chunk_y, variant)
+        self.texture.write(rasterize_chunk(tiles),
+                           viewport=(slot[0] * CHUNK_SIZE, slot[1] * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE))
+        self.uploads += 1
+
+    def update(self, tile_x, tile_y, variant=None, budget=MINIMAP_CHUNK_BUDGET):
+        """
+        Centre the map on a tile, mark the runner's trail, and rasterize up
+        to `budget` chunks in view that are missing or show another
+        variant, nearest first. chunk_source must produce `variant`.
+        """
+        self.center = (tile_x, tile_y)
+        tile = (int(round(tile_x)), int(round(tile_y)))
+        self._fill(tile[0] // CHUNK_SIZE, tile[1] // CHUNK_SIZE, variant, budget)
+
+        # After the fill, so a freshly uploaded chunk does not cover the mark
+        if tile != self.trail_tile:
+            self.trail_tile = tile
+            texel = (tile[0] % self.texture_size, tile[1] % self.texture_size, 1, 1)
+            self.texture.write(bytes(TRAIL_COLOR), viewport=texel)
+
+    def _fill(self, center_x, center_y, variant, budget):
+        if (center_x, center_y, variant) == self.complete_center:
+            return
+
+        for ring in range(MINIMAP_VIEW_CHUNKS + 1):
+            for dx in range(-ring, ring + 1):
+                for dy in range(-ring, ring + 1):
+                    if max(abs(dx), abs(dy)) != ring or \
+                            self.has_chunk(center_x + dx, center_y + dy, variant):
+                        continue
+                    if budget <= 0:
+                        return
+                    budget -= 1
+                    self.add_chunk(center_x + dx, center_y + dy,
+                                   self.chunk_source(center_x + dx, center_y + dy), variant)
+
+        # Everything in view is present until the runner changes chunk or variant
+        self.complete_center = (center_x, center_y, variant)
+
+    def draw(self):
+        self.program['u_center'] = self.center
+        self.texture.use(0)
+        with self.ctx.enabled(self.ctx.BLEND):
+            self.quad.render(self.program)
@@ -0,0 +1,283 @@
+"""Cross-process chunk store backed by multiprocessing.shared_memory.
+
+Several game or simulation processes with the same seed, terrain mode
+and wave mode attach to one named segment. A chunk generated by any of
+them is then readable by all of them.
+
+Segment layout:
+    header   int64[8]   capacity, chunk size, inserts, evictions, next
+                        FIFO victim, occupied blocks, longest probe, wave mode
+    slots    int64[capacity * TABLE_FACTOR, 4]   state, chunk_x, chunk_y, data index
+    data     uint8[capacity, CHUNK_SIZE, CHUNK_SIZE]
+
+The index is an open-addressing hash table. Readers never lock. They
+read a slot's state, key and data index, copy the data out, then read
+the slot again. A block is only overwritten after eviction has marked
+its slot deleted, so an unchanged slot means the copy is intact.
+Writers serialise on a lock file next to the segment and publish a slot
+by writing its state last.
+
+Eviction is FIFO over data blocks. get() and put() return copies, so
+callers never see a block change under them.
+"""
+import os
+import tempfile
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: callers must pass a lock of their own
+    fcntl = None
+
+from .constants import CHUNK_SIZE, MASTER_SEED
+
+HEADER_FIELDS = 8
+(H_CAPACITY, H_CHUNK_SIZE, H_INSERTS, H_EVICTIONS, H_NEXT_VICTIM, H_OCCUPIED, H_MAX_PROBE,
+ H_WAVE_MODE) = range(8)
+
+MASK64 = (1 << 64) - 1
+
+SLOT_EMPTY = 0
+SLOT_READY = 1
+SLOT_DELETED = 2
+
+# Hash table slots per data block; keeps probe chains short
+TABLE_FACTOR = 2
+
+
+class _FileLock:
+    """Inter-process lock on a file named after the segment, so unrelated processes agree on it."""
+
+    def __init__(self, name):
+        self.path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, 'a')
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self.file, fcntl.LOCK_UN)
+        self.file.close()
+
+
+def _mix(chunk_x, chunk_y):
+    """
+    splitmix64 of the packed chunk coordinates. The table layout is
+    shared between processes, so it must not depend on Python's hash().
+    """
+    z = (((chunk_x & 0xFFFFFFFF) << 32 | (chunk_y & 0xFFFFFFFF)) + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+def _segment_size(capacity):
+    table = capacity * TABLE_FACTOR
+    return 8 * HEADER_FIELDS + 8 * 4 * table + capacity * CHUNK_SIZE * CHUNK_SIZE
+
+
+def _attach(name):
+    """Attach to an existing segment without letting this process's exit destroy it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Python < 3.13 always registers the segment to be unlinked at exit
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def shared_cache_name(terrain_mode='quantum', master_seed=MASTER_SEED, wave_mode=False):
+    """Segment name shared by every process generating the same world."""
+    wave = '_wave' if wave_mode else ''
+    return f"mam_chunks_{terrain_mode}{wave}_{master_seed}_{CHUNK_SIZE}"
+
+
+def open_shared_cache(terrain_mode='quantum', master_seed=MASTER_SEED, capacity=4096, wave_mode=False):
+    """Attach to the shared cache for a world, creating it if this is the first process."""
+    name = shared_cache_name(terrain_mode, master_seed, wave_mode)
+    try:
+        return SharedChunkCache(name)
+    except FileNotFoundError:
+        pass
+    try:
+        return SharedChunkCache(name, capacity, create=True, wave_mode=wave_mode)
+    except FileExistsError:
+        # Another process created it between our two attempts
+        return SharedChunkCache(name)
+
+
+class SharedChunkCache:
+    """
+    Insert-once store of chunk tile arrays shared between processes.
+
+    Create it once with create=True, then attach from other processes by
+    name. Where fcntl is unavailable, every inserting process must pass
+    the same inter-process `lock` (e.g. a multiprocessing.Lock inherited
+    by child processes); without one, construction raises RuntimeError.
+    `wave_mode` records which variant of the terrain the store holds;
+    attaching processes read it from the segment.
+    """
+
+    def __init__(self, name=None, capacity=4096, create=False, lock=None, wave_mode=False):
+        if lock is None and fcntl is None:
+            raise RuntimeError("SharedChunkCache needs fcntl for its inter-process lock on this platform; "
+                               "pass a lock shared by every process")
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=_segment_size(capacity))
+        else:
+            self.shm = _attach(name)
+
+        if lock is not None:
+            self.lock = lock
+        else:
+            self.lock = _FileLock(self.shm.name)
+        self.owner = create
+
+        buffer = self.shm.buf
+        self.header = np.ndarray(HEADER_FIELDS, dtype=np.int64, buffer=buffer)
+        if create:
+            self.header[:] = 0
+            self.header[H_CAPACITY] = capacity
+            self.header[H_CHUNK_SIZE] = CHUNK_SIZE
+            self.header[H_WAVE_MODE] = int(wave_mode)
+        elif self.header[H_CHUNK_SIZE] != CHUNK_SIZE:
+            raise ValueError(f"shared chunk cache {name!r} uses chunk size {self.header[H_CHUNK_SIZE]}, "
+                             f"expected {CHUNK_SIZE}")
+
+        self.capacity = int(self.header[H_CAPACITY])
+        self.table_size = self.capacity * TABLE_FACTOR
+        table_offset = 8 * HEADER_FIELDS
+        data_offset = table_offset + 8 * 4 * self.table_size
+
+        self.slots = np.ndarray((self.table_size, 4), dtype=np.int64, buffer=buffer, offset=table_offset)
+        self.data = np.ndarray((self.capacity, CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8,
+                               buffer=buffer, offset=data_offset)
+        if create:
+            self.slots[:] = 0
+
+        # Per-process counters; shared ones live in the header
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def wave_mode(self):
+        return bool(self.header[H_WAVE_MODE])
+
+    def _probe(self, chunk_x, chunk_y, limit=None):
+        """Yield table slot indices in probe order for a chunk key."""
+        start = _mix(int(chunk_x), int(chunk_y)) % self.table_size
+        for i in range(self.table_size if limit is None else limit):
+            yield (start + i) % self.table_size
+
+    def _find(self, chunk_x, chunk_y):
+        """Return the table slot holding a chunk, or -1."""
+        # No insert ever probed further than H_MAX_PROBE, which keeps
+        # misses short even once evictions have left deleted slots behind
+        for index in self._probe(chunk_x, chunk_y, int(self.header[H_MAX_PROBE])):
+            state, slot_x, slot_y, _ = self.slots[index]
+            if state == SLOT_EMPTY:
+                return -1
+            if state == SLOT_READY and slot_x == chunk_x and slot_y == chunk_y:
+                return index
+        return -1
+
+    def get(self, chunk_x, chunk_y):
+        """Return a copy of a chunk's tiles, or None if no process has stored it."""
+        index = self._find(chunk_x, chunk_y)
+        if index < 0:
+            self.misses += 1
+            return None
+
+        block = self.slots[index, 3]
+        tiles = self.data[block].copy()
+        # The block may have been evicted and reused while we copied it
+        state, slot_x, slot_y, slot_block = self.slots[index]
+        if state != SLOT_READY or slot_x != chunk_x or slot_y != chunk_y or slot_block != block:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return tiles
+
+    def put(self, chunk_x, chunk_y, tiles):
+        """
+        Store a chunk unless some process already has (insert-once).
+        Returns a copy of the stored tiles, which may be another process's.
+        """
+        with self.lock:
+            index = self._find(chunk_x, chunk_y)
+            if index >= 0:
+                return self.data[self.slots[index, 3]].copy()
+
+            if self.header[H_OCCUPIED] >= self.capacity:
+                block = self._evict()
+            else:
+                block = int(self.header[H_OCCUPIED])
+                self.header[H_OCCUPIED] += 1
+
+            self.data[block] = tiles
+            for probes, index in enumerate(self._probe(chunk_x, chunk_y), 1):
+                if self.slots[index, 0] != SLOT_READY:
+                    break
+            self.header[H_MAX_PROBE] = max(self.header[H_MAX_PROBE], probes)
+
+            self.slots[index, 1] = chunk_x
+            self.slots[index, 2] = chunk_y
+            self.slots[index, 3] = block
+            # Publish last so readers never see a half-written slot
+            self.slots[index, 0] = SLOT_READY
+            self.header[H_INSERTS] += 1
+            return self.data[block].copy()
+
+    def _evict(self):
+        """Free the oldest data block (FIFO) and return its index. Lock held."""
+        block = int(self.header[H_NEXT_VICTIM])
+        self.header[H_NEXT_VICTIM] = (block + 1) % self.capacity
+
+        owners = np.nonzero((self.slots[:, 0] == SLOT_READY) & (self.slots[:, 3] == block))[0]
+        self.slots[owners, 0] = SLOT_DELETED
+        self.header[H_EVICTIONS] += 1
+        return block
+
+    def get_or_create(self, chunk_x, chunk_y, generate):
+        """Return a chunk's tiles, calling generate(chunk_x, chunk_y) and storing the result on a miss."""
+        tiles = self.get(chunk_x, chunk_y)
+        if tiles is None:
+            tiles = self.put(chunk_x, chunk_y, generate(chunk_x, chunk_y))
+        return tiles
+
+    def stats(self):
+        """Occupancy and eviction counts shared by all processes, plus this process's hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            'capacity': self.capacity,
+            'occupied': int(self.header[H_OCCUPIED]),
+            'occupancy': int(self.header[H_OCCUPIED]) / self.capacity,
+            'inserts': int(self.header[H_INSERTS]),
+            'evictions': int(self.header[H_EVICTIONS]),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        """Detach from the segment; the creating process also destroys it."""
+        del self.header, self.slots, self.data
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,157 @@
+"""Spatial queries over the per-tile obstacle grid.
+
+All queries work in tile coordinates (tile (i, j) covers [i-0.5, i+0.5] x
+[j-0.5, j+0.5], matching iso_to_screen) and cost time proportional to
+the number of tiles they visit. They never look at sprites, so they
+are cheap enough to run many times per tick.
+
+Hits are dicts with the tile, element name, distance in tiles and the
+element's hitbox from get_hitbox_for_element, in screen space around
+the tile's position.
+"""
+from math import ceil, cos, floor, hypot, inf, sin
+
+from .constants import CHUNK_SIZE, TILE_WIDTH, TILE_HEIGHT
+from .terrain_stream import COLLISION_MASK, TILE_ELEMENTS
+from .utils import get_hitbox_for_element, iso_to_screen
+
+
+class TileGrid:
+    """
+    Per-tile view of an infinite world, backed by any chunk source
+    (callable chunk_x, chunk_y -> tile array), e.g. ChunkCache.get,
+    BakedWorld.get or terrain_stream.chunk_tiles.
+    """
+
+    def __init__(self, chunk_source):
+        self.chunk_source = chunk_source
+        self._chunk_pos = None
+        self._tiles = None
+
+    def code_at(self, tile_x, tile_y):
+        chunk_x, local_x = divmod(tile_x, CHUNK_SIZE)
+        chunk_y, local_y = divmod(tile_y, CHUNK_SIZE)
+
+        # Queries walk neighbouring tiles, so the last chunk is usually the right one
+        if (chunk_x, chunk_y) != self._chunk_pos:
+            self._tiles = self.chunk_source(chunk_x, chunk_y)
+            self._chunk_pos = (chunk_x, chunk_y)
+        return self._tiles[local_x, local_y]
+
+    def is_solid(self, tile_x, tile_y):
+        return bool(COLLISION_MASK[self.code_at(tile_x, tile_y)])
+
+
+def heading_to_tile_direction(direction):
+    """Convert a screen-space heading (radians, as Character.direction) to a unit tile-space vector."""
+    half_x = cos(direction) / (TILE_WIDTH / 2)
+    half_y = sin(direction) / (TILE_HEIGHT / 2)
+    dir_x, dir_y = (half_x + half_y) / 2, (half_y - half_x) / 2
+    length = hypot(dir_x, dir_y)
+    return dir_x / length, dir_y / length
+
+
+def _hit(grid, tile_x, tile_y, distance):
+    element = TILE_ELEMENTS[grid.code_at(tile_x, tile_y)]
+    screen_x, screen_y = iso_to_screen(tile_x, tile_y)
+    return {
+        'tile': (tile_x, tile_y),
+        'element': element,
+        'distance': distance,
+        'hitbox': [(screen_x + px, screen_y + py) for px, py in get_hitbox_for_element(element)],
+    }
+
+
+def raycast(grid, origin_x, origin_y, dir_x, dir_y, max_distance=32.0):
+    """
+    Walk the tiles along a ray (DDA) and return the first solid tile as a
+    hit dict, or None if nothing solid lies within max_distance tiles.
+    The direction need not be normalised.
+    """
+    length = hypot(dir_x, dir_y)
+    if length == 0:
+        raise ValueError("raycast direction must be non-zero")
+    dir_x /= length
+    dir_y /= length
+
+    # Shift so tile (i, j) covers [i, i+1) and the walk is a plain grid DDA
+    pos_x = origin_x + 0.5
+    pos_y = origin_y + 0.5
+    tile_x = floor(pos_x)
+    tile_y = floor(pos_y)
+
+    step_x = 1 if dir_x > 0 else -1
+    step_y = 1 if dir_y > 0 else -1
+    delta_x = abs(1 / dir_x) if dir_x else inf
+    delta_y = abs(1 / dir_y) if dir_y else inf
+    next_x = ((tile_x + 1 - pos_x) if dir_x > 0 else (pos_x - tile_x)) * delta_x if dir_x else inf
+    next_y = ((tile_y + 1 - pos_y) if dir_y > 0 else (pos_y - tile_y)) * delta_y if dir_y else inf
+
+    distance = 0.0
+    while distance <= max_distance:
+        if grid.is_solid(tile_x, tile_y):
+            return _hit(grid, tile_x, tile_y, distance)
+
+        if next_x < next_y:
+            distance = next_x
+            next_x += delta_x
+            tile_x += step_x
+        else:
+            distance = next_y
+            next_y += delta_y
+            tile_y += step_y
+    return None
+
+
+def nearest_obstacle(grid, x, y, radius):
+    """
+    Return the solid tile whose centre is closest to (x, y) within
+    `radius` tiles, as a hit dict, or None. Searches outward ring by ring
+    and stops as soon as no farther ring can beat the best hit.
+    """
+    center_x = floor(x + 0.5)
+    center_y = floor(y + 0.5)
+    best = None
+    best_distance = inf
+
+    for ring in range(ceil(radius) + 1):
+        # Every tile in this ring is at least ring - 0.5 tiles from the point
+        if ring - 0.5 > best_distance:
+            break
+
+        for tile_x, tile_y in _ring(center_x, center_y, ring):
+            if not grid.is_solid(tile_x, tile_y):
+                continue
+            distance = hypot(tile_x - x, tile_y - y)
+            if distance <= radius and distance < best_distance:
+                best = (tile_x, tile_y)
+                best_distance = distance
+
+    return _hit(grid, *best, best_distance) if best else None
+
+
+def _ring(center_x, center_y, ring):
+    """Tiles at Chebyshev distance `ring` from the centre tile."""
+    if ring == 0:
+        yield center_x, center_y
+        return
+    for offset in range(-ring, ring + 1):
+        yield center_x + offset, center_y - ring
+        yield center_x + offset, center_y + ring
+    for offset in range(-ring + 1, ring):
+        yield center_x - ring, center_y + offset
+        yield center_x + ring, center_y + offset
+
+
+def free_corridor_width(grid, x, y, dir_x, dir_y, max_width=16.0):
+    """
+    Measure free space perpendicular to a heading at (x, y): cast rays to
+    the left and right and report the clear distance each way (capped at
+    max_width / 2) and their sum as the corridor width, in tiles.
+    """
+    half = max_width / 2
+    left = raycast(grid, x, y, -dir_y, dir_x, half)
+    right = raycast(grid, x, y, dir_y, -dir_x, half)
+    left_clear = left['distance'] if left else half
+    right_clear = right['distance'] if right else half
+    return {'left': left_clear, 'right': right_clear, 'width': left_clear + right_clear}
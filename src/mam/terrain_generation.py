@@ -0,0 +1,207 @@
+"""Terrain generation functions using quantum states."""
+import random
+from math import sin, cos, pi
+
+import numpy as np
+
+from .biomes import BIOMES, DEFAULT_BIOME
+from .constants import CHUNK_SIZE, COIN_SPAWN_CHANCE, MASTER_SEED
+from .quantum_state import QuantumState
+from .utils import get_chunk_seed
+
+
+def quantum_terrain(tile_x, tile_y):
+    """Generate terrain using quantum states"""
+    q = QuantumState(tile_x, tile_y)
+
+    # Step 1: Create superposition
+    q.hadamard()
+
+    # Step 2: Introduce coordinate-dependent rotation
+    theta = (sin(tile_x * 0.15) + cos(tile_y * 0.13)) * pi / 2
+    q.ry(theta)
+
+    # Step 3: Local interference
+    phi = ((tile_x * 0.23 + tile_y * 0.37) % (2 * pi)) * 0.5
+    q.phase_shift(phi)
+
+    # Step 4: Another layer of Y-rotation for pattern complexity
+    q.ry((tile_x * tile_y * 0.002) % (pi / 2))
+
+    # Step 5: Measurement
+    density = q.measure()
+
+    # Optional: smooth second state for variation
+    q2 = QuantumState(tile_y, tile_x)
+    q2.hadamard()
+    q2.ry(sin(tile_y * 0.21) * pi / 3)
+    variation = q2.measure()
+
+    combined = (density + 0.6 * variation) / 1.6
+
+    if combined < 0.75:
+        return None
+    elif combined < 0.78:
+        return 'tree_thin_fall'
+    elif combined < 0.80:
+        return 'tree_fat_fall'
+    elif combined < 0.82:
+        return 'tree_oak_fall'
+    elif combined < 0.85:
+        return 'stone_large'
+    elif combined < 0.87:
+        return 'log'
+    else:
+        return 'stone_tall' if (tile_x + tile_y) % 3 == 0 else 'bush_small'
+
+
+def quantum_terrain_phase(tile_x, tile_y):
+    """Generate terrain using standard quantum phase logic."""
+    q = QuantumState(tile_x, tile_y)
+    q.hadamard()
+    q.rotate(tile_x * 0.1)
+    q.hadamard()
+    density = q.measure()
+    return terrain_type_from_density(density)
+
+
+def quantum_terrain_ry(tile_x, tile_y):
+    """Generate terrain using an RY quantum gate instead of rotation."""
+    q = QuantumState(tile_x, tile_y)
+    q.hadamard()
+    q.ry(tile_x * 0.3 + tile_y * 0.2)
+    q.hadamard()
+    q.ry(tile_y * 0.15)
+    density = q.measure()
+    return terrain_type_from_density(density)
+
+
+def hybrid_terrain(tile_x, tile_y, wave_mode):
+    """Mix terrain types between phase-based and RY-based depending on state."""
+    if not wave_mode:
+        if (tile_x + tile_y) % 7 < 5:
+            return quantum_terrain_phase(tile_x, tile_y)
+        else:
+            return quantum_terrain_ry(tile_x, tile_y)
+    else:
+        if (tile_x * tile_y) % 5 < 3:
+            return quantum_terrain_ry(tile_x, tile_y)
+        else:
+            return quantum_terrain_phase(tile_x, tile_y)
+
+
+def terrain_type_from_density(d):
+    """Convert density value to terrain type."""
+    if d < 0.35:
+        return None
+    elif d < 0.45:
+        return 'tree_thin'
+    elif d < 0.60:
+        return 'tree_oak_fall'
+    elif d < 0.65:
+        return 'tree_fat_fall'
+    elif d < 0.70:
+        return 'stone_large'
+    elif d < 0.75:
+        return 'stone_tall'
+    elif d < 0.80:
+        return 'log'
+    else:
+        return 'bush_small'
+
+
+def random_terrain(rng):
+    """Generate terrain using classical pseudo-random numbers for comparison."""
+    noise = rng.random()
+    if noise < 0.35:
+        tree_type = rng.random()
+        if tree_type < 0.3:
+            return 'tree_blocks_fall'
+        elif tree_type < 0.5:
+            return 'tree_oak_fall'
+        elif tree_type < 0.7:
+            return 'tree_default_fall'
+        elif tree_type < 0.85:
+            return 'tree_fat_fall'
+        else:
+            return 'tree_thin_fall'
+    elif noise < 0.40:
+        return 'stone_tall' if rng.random() < 0.7 else 'stone_large'
+    elif noise < 0.43:
+        return 'log' if rng.random() < 0.6 else 'log_large'
+    elif noise < 0.48:
+        return 'bush_small'
+    else:
+        return None
+
+
+def compile_biome(table):
+    """
+    Split a biome's (element, probability) pairs into its elements and the
+    cumulative probabilities to searchsorted uniform draws against.
+    """
+    total = sum(probability for _, probability in table)
+    if abs(total - 1) > 1e-9:
+        raise ValueError(f"biome probabilities sum to {total}, not 1")
+
+    elements = tuple(element for element, _ in table)
+    cumulative = np.cumsum([probability for _, probability in table])
+    cumulative[-1] = 1.0
+    return elements, cumulative
+
+
+BIOME_TABLES = {name: compile_biome(table) for name, table in BIOMES.items()}
+
+
+def table_terrain(chunk_x, chunk_y, biome=DEFAULT_BIOME, master_seed=MASTER_SEED):
+    """
+    Choose a whole chunk from a biome probability table ('fast_random' mode):
+    one uniform draw per tile from a NumPy generator seeded per chunk.
+    Returns a (CHUNK_SIZE, CHUNK_SIZE) array, indexed [local_x, local_y],
+    of indices into the biome's elements.
+    """
+    _, cumulative = BIOME_TABLES[biome]
+    rng = np.random.default_rng(get_chunk_seed(chunk_x, chunk_y, master_seed))
+    return np.searchsorted(cumulative, rng.random((CHUNK_SIZE, CHUNK_SIZE)), side='right')
+
+
+def terrain_element(tile_x, tile_y, rng, terrain_mode='quantum', wave_mode=False):
+    """Determine what terrain element to place at this position"""
+    if terrain_mode == 'quantum':
+        return hybrid_terrain(tile_x, tile_y, wave_mode)
+    if terrain_mode == 'random':
+        return random_terrain(rng)
+    raise ValueError(f"no per-tile terrain for mode {terrain_mode!r}")
+
+
+def generate_chunk(chunk_x, chunk_y, terrain_mode='quantum', wave_mode=False, master_seed=MASTER_SEED):
+    """
+    Yield (tile_x, tile_y, element, has_coin) for every tile of a chunk.
+    Tiles are visited in the same order the game builds them, so the
+    per-chunk random stream (and therefore coin placement) is identical.
+    """
+    start_tile_x = chunk_x * CHUNK_SIZE
+    start_tile_y = chunk_y * CHUNK_SIZE
+
+    if terrain_mode == 'fast_random':
+        elements, _ = BIOME_TABLES[DEFAULT_BIOME]
+        choices = table_terrain(chunk_x, chunk_y, master_seed=master_seed)
+        for x in range(CHUNK_SIZE):
+            for y in range(CHUNK_SIZE):
+                element = elements[choices[x, y]]
+                if element == 'coin':
+                    yield start_tile_x + x, start_tile_y + y, None, True
+                else:
+                    yield start_tile_x + x, start_tile_y + y, element, False
+        return
+
+    rng = random.Random(get_chunk_seed(chunk_x, chunk_y, master_seed))
+
+    for x in range(CHUNK_SIZE):
+        for y in range(CHUNK_SIZE):
+            tile_x = start_tile_x + x
+            tile_y = start_tile_y + y
+
+            element = terrain_element(tile_x, tile_y, rng, terrain_mode, wave_mode)
+            has_coin = element is None and rng.random() < COIN_SPAWN_CHANCE
+            yield tile_x, tile_y, element, has_coin
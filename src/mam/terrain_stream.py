@@ -0,0 +1,166 @@
+"""Lazy, sprite-free terrain streaming over arbitrarily large areas.
+
+Chunks are produced as compact tile-code arrays so that terrain can be
+analysed without arcade, sprites, or holding the world in memory.
+"""
+from collections import OrderedDict
+from math import floor
+
+import numpy as np
+
+from .biomes import DEFAULT_BIOME
+from .constants import CHUNK_SIZE, MASTER_SEED
+from .terrain_generation import BIOME_TABLES, generate_chunk, table_terrain
+from .utils import has_collision
+
+# Tile code table: the index of a name is its code in a chunk array.
+TILE_ELEMENTS = (
+    None,
+    'tree_blocks_fall', 'tree_default_fall', 'tree_fat_fall',
+    'tree_thin_fall', 'tree_oak_fall', 'tree_tall_fall', 'tree_thin',
+    'stone_tall', 'stone_large', 'log', 'log_large', 'bush_small',
+    'coin'
+)
+ELEMENT_CODES = {name: code for code, name in enumerate(TILE_ELEMENTS)}
+TILE_EMPTY = ELEMENT_CODES[None]
+TILE_COIN = ELEMENT_CODES['coin']
+
+# Lookup table: COLLISION_MASK[code] is True for solid tiles
+COLLISION_MASK = np.array([name is not None and has_collision(name) for name in TILE_ELEMENTS])
+
+
+# BIOME_CODES[biome][i] is the tile code of the biome's i-th element
+BIOME_CODES = {
+    name: np.array([ELEMENT_CODES[element] for element in elements], dtype=np.uint8)
+    for name, (elements, _) in BIOME_TABLES.items()
+}
+
+
+def table_tiles(chunk_x, chunk_y, biome=DEFAULT_BIOME, master_seed=MASTER_SEED):
+    """
+    Generate a chunk from a biome probability table ('fast_random' mode)
+    without visiting tiles one by one; same world as generate_chunk.
+    """
+    return BIOME_CODES[biome][table_terrain(chunk_x, chunk_y, biome, master_seed)]
+
+
+def chunk_tiles(chunk_x, chunk_y, terrain_mode='quantum', wave_mode=False, master_seed=MASTER_SEED):
+    """
+    Generate one chunk as a (CHUNK_SIZE, CHUNK_SIZE) uint8 array of tile
+    codes, indexed [local_x, local_y]. Coins are stored on empty tiles.
+    """
+    if terrain_mode == 'fast_random':
+        return table_tiles(chunk_x, chunk_y, master_seed=master_seed)
+
+    tiles = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+    start_tile_x = chunk_x * CHUNK_SIZE
+    start_tile_y = chunk_y * CHUNK_SIZE
+
+    for tile_x, tile_y, element, has_coin in generate_chunk(
+            chunk_x, chunk_y, terrain_mode, wave_mode, master_seed):
+        code = TILE_COIN if has_coin else ELEMENT_CODES[element]
+        tiles[tile_x - start_tile_x, tile_y - start_tile_y] = code
+    return tiles
+
+
+def iter_region(chunk_x0, chunk_y0, chunk_x1, chunk_y1, terrain_mode='quantum', wave_mode=False,
+                master_seed=MASTER_SEED):
+    """
+    Lazily yield (chunk_x, chunk_y, tiles) for every chunk in the half-open
+    rectangle [chunk_x0, chunk_x1) x [chunk_y0, chunk_y1), row by row.
+    Only one chunk is alive at a time.
+    """
+    for chunk_y in range(chunk_y0, chunk_y1):
+        for chunk_x in range(chunk_x0, chunk_x1):
+            yield chunk_x, chunk_y, chunk_tiles(chunk_x, chunk_y, terrain_mode, wave_mode, master_seed)
+
+
+def iter_path(tile_points, radius=0, terrain_mode='quantum', wave_mode=False, memory=256,
+              master_seed=MASTER_SEED):
+    """
+    Lazily yield (chunk_x, chunk_y, tiles) for the chunks a path of tile
+    positions passes through, plus `radius` chunks around each of them.
+
+    Chunks are yielded at most once while they remain among the `memory`
+    most recently visited chunks, which bounds memory for paths of any
+    length. A path that loops back after leaving that window revisits
+    chunks.
+    """
+    seen = OrderedDict()
+
+    for tile_x, tile_y in tile_points:
+        # Nearest tile, as screen_to_chunk rounds
+        center_x = floor(tile_x + 0.5) // CHUNK_SIZE
+        center_y = floor(tile_y + 0.5) // CHUNK_SIZE
+
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                chunk_pos = (center_x + dx, center_y + dy)
+                if chunk_pos in seen:
+                    seen.move_to_end(chunk_pos)
+                    continue
+
+                seen[chunk_pos] = True
+                if len(seen) > memory:
+                    seen.popitem(last=False)
+                yield chunk_pos[0], chunk_pos[1], chunk_tiles(*chunk_pos, terrain_mode, wave_mode, master_seed)
+
+
+class ElementHistogram:
+    """Streaming count of every tile code seen."""
+
+    def __init__(self):
+        self.counts = np.zeros(len(TILE_ELEMENTS), dtype=np.int64)
+
+    def update(self, chunk_x, chunk_y, tiles):
+        self.counts += np.bincount(tiles.ravel(), minlength=len(TILE_ELEMENTS))
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def as_dict(self):
+        """Return counts keyed by element name ('empty' for bare ground)."""
+        return {name or 'empty': int(count) for name, count in zip(TILE_ELEMENTS, self.counts)}
+
+
+class ObstacleDensity:
+    """
+    Streaming fraction of solid tiles per chunk.
+    Running min/mean/max are always kept; per-chunk values only when keep=True.
+    """
+
+    def __init__(self, keep=False):
+        self.chunks = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.densities = {} if keep else None
+
+    def update(self, chunk_x, chunk_y, tiles):
+        density = float(COLLISION_MASK[tiles].mean())
+
+        self.chunks += 1
+        self.total += density
+        self.min = density if self.min is None else min(self.min, density)
+        self.max = density if self.max is None else max(self.max, density)
+        if self.densities is not None:
+            self.densities[(chunk_x, chunk_y)] = density
+
+    @property
+    def mean(self):
+        return self.total / self.chunks if self.chunks else 0.0
+
+
+def reduce_chunks(chunks, *reducers):
+    """
+    Feed a chunk stream through every reducer in a single pass.
+    Returns the reducers so results can be read directly:
+
+        hist, density = reduce_chunks(iter_region(0, 0, 64, 64),
+                                      ElementHistogram(), ObstacleDensity())
+    """
+    for chunk_x, chunk_y, tiles in chunks:
+        for reducer in reducers:
+            reducer.update(chunk_x, chunk_y, tiles)
+    return reducers
@@ -0,0 +1,48 @@
+"""Fixed-timestep accumulator decoupling simulation rate from render rate."""
+from .constants import SIM_DT, MAX_SIM_STEPS_PER_FRAME
+
+
+class FixedTimestep:
+    """
+    Accumulates real frame time and hands out whole simulation steps.
+
+    Slow frames produce several steps so the simulation keeps real-time pace;
+    beyond max_steps the backlog is dropped instead of spiralling. `alpha`
+    is how far the renderer is between the last two simulation states.
+    """
+
+    def __init__(self, step=SIM_DT, max_steps=MAX_SIM_STEPS_PER_FRAME):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps = 0
+        self.dropped_time = 0.0
+
+    def advance(self, delta_time):
+        """Add a frame's elapsed time and return how many steps to simulate."""
+        self.accumulator += delta_time
+        steps = int(self.accumulator / self.step)
+
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = self.step * steps + self.accumulator % self.step
+
+        self.accumulator -= steps * self.step
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Interpolation factor (0-1) between the previous and current step."""
+        return min(self.accumulator / self.step, 1.0)
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.steps = 0
+        self.dropped_time = 0.0
+
+
+def lerp(a, b, t):
+    """Linear interpolation between two numbers."""
+    return a + (b - a) * t
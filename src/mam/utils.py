@@ -1,6 +1,6 @@
 """Utility functions for coordinate conversion and collision detection."""
 import math
-from constants import TILE_WIDTH, TILE_HEIGHT, CHUNK_SIZE, MASTER_SEED
+from .constants import TILE_WIDTH, TILE_HEIGHT, CHUNK_SIZE, MASTER_SEED
 
 
 def iso_to_screen(iso_x, iso_y):
@@ -10,20 +10,25 @@ def iso_to_screen(iso_x, iso_y):
     return screen_x, screen_y
 
 
+def screen_to_iso(screen_x, screen_y):
+    """Convert screen coordinates to (fractional) isometric grid coordinates"""
+    half_x = screen_x / (TILE_WIDTH / 2)
+    half_y = screen_y / (TILE_HEIGHT / 2)
+    return (half_x + half_y) / 2, (half_y - half_x) / 2
+
+
 def screen_to_chunk(screen_x, screen_y):
-    """Convert screen coordinates to chunk coordinates"""
-    tiles_per_chunk = CHUNK_SIZE
-    chunk_x = int(screen_x / (TILE_WIDTH * tiles_per_chunk / 2))
-    chunk_y = int(screen_y / (TILE_HEIGHT * tiles_per_chunk / 2))
-    return chunk_x, chunk_y
+    """Convert screen coordinates to the coordinates of the chunk containing them"""
+    iso_x, iso_y = screen_to_iso(screen_x, screen_y)
+    return math.floor(iso_x + 0.5) // CHUNK_SIZE, math.floor(iso_y + 0.5) // CHUNK_SIZE
 
 
-def get_chunk_seed(chunk_x, chunk_y):
+def get_chunk_seed(chunk_x, chunk_y, master_seed=MASTER_SEED):
     """Generate a unique seed for each chunk using activation function"""
     center_x = chunk_x * CHUNK_SIZE + CHUNK_SIZE // 2
     center_y = chunk_y * CHUNK_SIZE + CHUNK_SIZE // 2
 
-    combined = MASTER_SEED * math.sin(center_x * 0.1) * math.cos(center_y * 0.1)
+    combined = master_seed * math.sin(center_x * 0.1) * math.cos(center_y * 0.1)
     combined += (center_x * 73856093) ^ (center_y * 19349663)
 
     activated_seed = int(abs(combined * 1000) % (2 ** 31 - 1))
@@ -0,0 +1,29 @@
+import os
+
+import numpy as np
+
+from mam.bake import BakedWorld, bake
+from mam.terrain_stream import chunk_tiles
+
+
+def test_wave_mode_bake(tmp_path):
+    path = os.path.join(tmp_path, 'wave.mamw')
+    bake(path, (0, 0, 2, 1), 'quantum', wave_mode=True, workers=1, progress=False)
+    world = BakedWorld(path)
+    try:
+        assert world.matches('quantum', wave_mode=True)
+        assert not world.matches('quantum', wave_mode=False)
+        assert np.array_equal(world.get(1, 0), chunk_tiles(1, 0, 'quantum', wave_mode=True))
+    finally:
+        world.close()
+
+
+def test_matches_ignores_wave_mode_where_terrain_does_not_change(tmp_path):
+    path = os.path.join(tmp_path, 'random.mamw')
+    bake(path, (0, 0, 1, 1), 'random', workers=1, progress=False)
+    world = BakedWorld(path)
+    try:
+        assert world.matches('random', wave_mode=True)
+        assert np.array_equal(world.get(0, 0), chunk_tiles(0, 0, 'random', wave_mode=True))
+    finally:
+        world.close()
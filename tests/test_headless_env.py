@@ -0,0 +1,64 @@
+import numpy as np
+
+from mam.constants import MAX_QUANTUM_ENERGY
+from mam.headless_env import ChunkCache, HeadlessRunnerEnv
+from mam.shared_chunks import SharedChunkCache
+from mam.terrain_stream import chunk_tiles
+
+
+def test_held_wave_request_recharges_after_drain():
+    env = HeadlessRunnerEnv(1, terrain_mode='fast_random')
+    turn = np.zeros(1, dtype=np.int64)
+    held = np.ones(1, dtype=bool)
+
+    env.step(turn, held)
+    assert env.wave[0]
+
+    # Hold until drained
+    steps = 0
+    while env.wave[0]:
+        env.step(turn, held)
+        steps += 1
+        assert steps < 10_000
+    assert env.energy[0] == 0
+
+    # Still held: wave mode stays off and energy recharges steadily
+    energy = env.energy[0]
+    for _ in range(100):
+        env.step(turn, held)
+        assert not env.wave[0]
+        assert env.energy[0] > energy
+        energy = env.energy[0]
+
+    # A fresh request re-enters wave mode
+    env.step(turn, ~held)
+    env.step(turn, held)
+    assert env.wave[0]
+
+
+def test_wave_request_needs_energy():
+    env = HeadlessRunnerEnv(2, terrain_mode='fast_random')
+    env.energy[:] = [0, MAX_QUANTUM_ENERGY]
+    env.step(np.zeros(2, dtype=np.int64), np.ones(2, dtype=bool))
+    assert env.wave.tolist() == [False, True]
+
+
+def test_chunk_cache_survives_shared_eviction():
+    shared = SharedChunkCache(capacity=8, create=True)
+    try:
+        cache = ChunkCache('fast_random', shared=shared)
+        other = ChunkCache('fast_random', shared=SharedChunkCache(shared.name))
+        expected = chunk_tiles(0, 0, 'fast_random')
+        assert np.array_equal(cache.get(0, 0), expected)
+
+        # Another process fills the store, evicting and reusing (0, 0)'s block
+        for x in range(1, 9):
+            other.get(x, 0)
+        assert shared.stats()['evictions'] > 0
+
+        assert cache.hits == 0
+        assert np.array_equal(cache.get(0, 0), expected)
+        assert cache.hits == 1
+        other.shared.close()
+    finally:
+        shared.close()
@@ -0,0 +1,44 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('ARCADE_HEADLESS', '1')
+arcade = pytest.importorskip('arcade')
+
+from mam.constants import CHUNK_SIZE  # noqa: E402
+from mam.render.minimap import Minimap, rasterize_chunk  # noqa: E402
+from mam.terrain_stream import chunk_tiles  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def ctx():
+    window = arcade.Window(64, 64, visible=False)
+    yield window.ctx
+    window.close()
+
+
+def block(minimap, chunk_x, chunk_y):
+    """The RGBA texels of a chunk's slot, indexed [row=y, column=x]."""
+    size = minimap.texture_size
+    texels = np.frombuffer(minimap.texture.read(), dtype=np.uint8).reshape(size, size, 4)
+    slot_x, slot_y = minimap._slot(chunk_x, chunk_y)
+    return texels[slot_y * CHUNK_SIZE:(slot_y + 1) * CHUNK_SIZE, slot_x * CHUNK_SIZE:(slot_x + 1) * CHUNK_SIZE]
+
+
+def test_switching_variant_reuploads_chunks(ctx):
+    mode = ['quantum']
+    minimap = Minimap(ctx, lambda x, y: chunk_tiles(x, y, mode[0]))
+
+    minimap.add_chunk(0, 0, chunk_tiles(0, 0, 'quantum'), 'quantum')
+    minimap.update(0.0, 0.0, 'quantum', budget=1000)
+    assert np.array_equal(block(minimap, 2, 1), rasterize_chunk(chunk_tiles(2, 1, 'quantum')))
+
+    # A chunk created after the switch is uploaded, not skipped
+    mode[0] = 'random'
+    minimap.add_chunk(0, 0, chunk_tiles(0, 0, 'random'), 'random')
+    assert np.array_equal(block(minimap, 0, 0), rasterize_chunk(chunk_tiles(0, 0, 'random')))
+
+    # And the rest of the view is refreshed by the fill
+    minimap.update(0.0, 0.0, 'random', budget=1000)
+    assert np.array_equal(block(minimap, 2, 1), rasterize_chunk(chunk_tiles(2, 1, 'random')))
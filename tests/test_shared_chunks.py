@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from mam.headless_env import ChunkCache
+from mam.shared_chunks import SharedChunkCache, shared_cache_name
+from mam.terrain_stream import chunk_tiles
+
+
+def test_returned_tiles_survive_eviction():
+    shared = SharedChunkCache(capacity=2, create=True)
+    try:
+        tiles = shared.put(0, 0, np.full((16, 16), 7, dtype=np.uint8))
+        for x in range(1, 3):
+            shared.put(x, 0, np.full((16, 16), x, dtype=np.uint8))
+        assert shared.get(0, 0) is None
+        assert (tiles == 7).all()
+    finally:
+        shared.close()
+
+
+def test_lookup_after_reattach():
+    shared = SharedChunkCache(capacity=64, create=True)
+    try:
+        for x in range(-8, 8):
+            shared.put(x, -x, chunk_tiles(x, -x, 'fast_random'))
+        other = SharedChunkCache(shared.name)
+        assert all(np.array_equal(other.get(x, -x), chunk_tiles(x, -x, 'fast_random')) for x in range(-8, 8))
+        other.close()
+    finally:
+        shared.close()
+
+
+def test_wave_mode_is_part_of_the_store():
+    assert shared_cache_name('quantum', wave_mode=True) != shared_cache_name('quantum')
+
+    shared = SharedChunkCache(capacity=8, create=True)
+    try:
+        with pytest.raises(ValueError):
+            ChunkCache('quantum', wave_mode=True, shared=shared)
+        # Random terrain does not change with wave mode
+        ChunkCache('random', wave_mode=True, shared=shared)
+    finally:
+        shared.close()
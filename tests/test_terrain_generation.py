@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from mam.constants import CHUNK_SIZE
+from mam.terrain_generation import generate_chunk
+from mam.terrain_stream import ELEMENT_CODES, TILE_COIN, chunk_tiles
+
+
+@pytest.mark.parametrize('terrain_mode', ['quantum', 'random', 'fast_random'])
+def test_generate_chunk_matches_chunk_tiles(terrain_mode):
+    tiles = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+    for tile_x, tile_y, element, has_coin in generate_chunk(3, -2, terrain_mode):
+        tiles[tile_x - 3 * CHUNK_SIZE, tile_y + 2 * CHUNK_SIZE] = TILE_COIN if has_coin else ELEMENT_CODES[element]
+    assert np.array_equal(tiles, chunk_tiles(3, -2, terrain_mode))
+
+
+def test_unknown_terrain_mode_raises():
+    with pytest.raises(ValueError):
+        chunk_tiles(0, 0, 'perlin')
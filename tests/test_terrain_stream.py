@@ -0,0 +1,6 @@
+from mam.terrain_stream import iter_path
+
+
+def test_iter_path_rounds_to_nearest_tile():
+    chunks = [(x, y) for x, y, _ in iter_path([(-0.7, 0.2), (15.6, -16.4)], terrain_mode='fast_random')]
+    assert chunks == [(-1, 0), (1, -1)]